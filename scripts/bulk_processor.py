@@ -32,6 +32,14 @@ class BulkProcessor:
         self.batch_size = config.get('bulk_processing', {}).get('batch_size', 10)
         self.delay_between_batches = config.get('bulk_processing', {}).get('delay', 2.0)
         
+        # Adaptive pacing between batches, see _pace_between_batches
+        self._batch_delay = self.delay_between_batches
+        self._calm_batches = 0
+        # Start from the shared client's counters so requests made before this processor
+        # existed are not charged to its first batch
+        self._seen_requests = self.repo_manager.github.request_count
+        self._seen_throttles = self.repo_manager.github.throttle_count
+        
         # Progress tracking
         self.progress_data = {
             'total_items': 0,
@@ -67,24 +75,11 @@ class BulkProcessor:
             # Process in batches
             def create_folder_batch(batch_students):
                 batch_results = []
-                for student in batch_students:
-                    try:
-                        logger.info(f"Creating folder for {student['index_number']}")
-                        
-                        # Create student folder
-                        folder_result = self.repo_manager.create_student_folder(student)
-                        batch_results.append(folder_result)
-                        
-                        self._update_progress(1, progress_callback, folder_result.get('status') == 'success')
-                        
-                    except Exception as e:
-                        error_result = {
-                            'status': 'error',
-                            'student': student,
-                            'error': str(e)
-                        }
-                        batch_results.append(error_result)
-                        self._update_progress(1, progress_callback, False)
+                # Folders within a batch are created concurrently, results come back in order
+                for folder_result in self.repo_manager.iter_student_folders(batch_students):
+                    logger.info(f"Created folder for {folder_result['student']['index_number']}: {folder_result.get('status')}")
+                    batch_results.append(folder_result)
+                    self._update_progress(1, progress_callback, folder_result.get('status') == 'success')
                 
                 return batch_results
             
@@ -102,8 +97,8 @@ class BulkProcessor:
                 
                 # Rate limiting between batches
                 if i + self.batch_size < len(students):
-                    logger.info(f"Completed batch {batch_number}, waiting {self.delay_between_batches}s...")
-                    time.sleep(self.delay_between_batches)
+                    logger.info(f"Completed batch {batch_number}")
+                    self._pace_between_batches(len(students) - i - self.batch_size)
             
             # Process results
             for result in all_results:
@@ -183,7 +178,7 @@ class BulkProcessor:
                 
                 # Rate limiting between batches
                 if i + self.batch_size < len(students):
-                    time.sleep(self.delay_between_batches)
+                    self._pace_between_batches(len(students) - i - self.batch_size)
             
             # Generate summary
             results['summary'] = self._generate_summary(results)
@@ -261,7 +256,7 @@ class BulkProcessor:
                 
                 # Rate limiting between batches
                 if i + self.batch_size < len(students):
-                    time.sleep(self.delay_between_batches)
+                    self._pace_between_batches(len(students) - i - self.batch_size)
             
             # Send supervisor invitations
             logger.info("Sending supervisor invitations...")
@@ -362,7 +357,7 @@ class BulkProcessor:
                 
                 # Rate limiting between batches
                 if i + self.batch_size < len(students):
-                    time.sleep(self.delay_between_batches)
+                    self._pace_between_batches(len(students) - i - self.batch_size)
             
             # Generate summary
             results['summary'] = self._generate_summary(results)
@@ -674,6 +669,9 @@ class BulkProcessor:
                     })
                     self._update_progress(1, progress_callback, False)
             
+            if operation_type == 'folder_creation':
+                self.repo_manager.save_checkpoint()
+            
             # Generate summary
             retry_results['summary'] = self._generate_summary(retry_results)
             
@@ -769,6 +767,36 @@ class BulkProcessor:
         
         return metrics
 
+    def _pace_between_batches(self, items_left: int):
+        """Sleep between batches based on remaining quota and recent throttling"""
+        github = self.repo_manager.github
+        requests_used = github.request_count - self._seen_requests
+        throttled = github.throttle_count > self._seen_throttles
+        self._seen_requests = github.request_count
+        self._seen_throttles = github.throttle_count
+        
+        # Back off quickly while GitHub is throttling, relax after 5 clean batches
+        if throttled:
+            self._batch_delay = min(max(self._batch_delay * 2, 1.0), 60.0)
+            self._calm_batches = 0
+        else:
+            self._calm_batches += 1
+            if self._calm_batches >= 5:
+                self._batch_delay = self._batch_delay / 2 if self._batch_delay >= 0.1 else 0.0
+                self._calm_batches = 0
+        
+        # Only stretch batches over the reset window when the quota cannot cover the items left
+        quota_delay = 0.0
+        needed = requests_used * items_left / max(self.batch_size, 1)
+        if needed > github.rate_limit_remaining:
+            window = max(0.0, (github.rate_limit_reset - datetime.now()).total_seconds())
+            quota_delay = window * requests_used / max(github.rate_limit_remaining, 1)
+        
+        delay = min(max(self._batch_delay, quota_delay), 3600)
+        if delay > 0:
+            logger.info(f"Waiting {delay:.1f}s before next batch")
+            time.sleep(delay)
+    
     # Enhanced progress tracking methods
     def _initialize_progress(self, total_items: int, operation: str):
         """Initialize progress tracking"""
@@ -0,0 +1,9 @@
+"""
+Exceptions shared by the GitHub client and the batch helpers
+"""
+
+class RateLimitExceeded(Exception):
+    """GitHub kept throttling a request after every retry"""
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
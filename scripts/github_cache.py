@@ -0,0 +1,94 @@
+"""
+On-disk ETag cache for GitHub GET responses
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+class ResponseCache:
+    def __init__(self, cache_dir: str = 'data/cache/github', ttl: float = 900, max_entries: int = 512):
+        self.cache_dir = cache_dir
+        self.ttl = ttl  # Freshness window for responses that carry no ETag
+        # Recently used entries stay in memory; colder ones are read back from disk
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, url: str, params: Optional[Dict] = None) -> str:
+        """Build cache key from full request URL and query parameters"""
+        if params:
+            url = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get cached entry ({etag, body, ts}) from memory or disk"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            return entry
+
+        try:
+            with open(self._entry_path(key), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {key}: {e}")
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Check if an ETag-less entry can be served without revalidation"""
+        return not entry.get('etag') and time.time() - entry.get('ts', 0) < self.ttl
+
+    def set(self, key: str, etag: Optional[str], body: Any):
+        """Store response body with its ETag"""
+        entry = {'etag': etag, 'body': body, 'ts': time.time()}
+
+        self._remember(key, entry)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self._entry_path(key)}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception as e:
+            logger.debug(f"Could not persist cache entry {key}: {e}")
+
+    def invalidate(self, key: str):
+        """Drop cached entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Could not remove cache entry {key}: {e}")
+
+    def _remember(self, key: str, entry: Dict):
+        """Keep entry in memory, evicting the least recently used beyond max_entries"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
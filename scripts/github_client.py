@@ -4,18 +4,45 @@ GitHub API client with rate limiting and batch operations
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import random
+import threading
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 import json
+from concurrent.futures import ThreadPoolExecutor
+from .github_cache import ResponseCache
+from .exceptions import RateLimitExceeded
+from .utils import git_blob_sha
+
+try:
+    import orjson
+except ImportError:  # Optional, the standard json module is used without it
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def dump_json(payload: Any) -> bytes:
+    """Serialize a request body to compact UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def load_json(data: bytes) -> Any:
+    """Parse a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class GitHubClient:
-    def __init__(self, token: str, base_url: str = "https://api.github.com"):
+    def __init__(self, token: str, base_url: str = "https://api.github.com", cache_dir: str = 'data/cache/github',
+                 pool_size: int = 20):
         self.token = token
         self.base_url = base_url
+        self.cache = ResponseCache(cache_dir)
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'token {token}',
@@ -23,34 +50,49 @@ class GitHubClient:
             'User-Agent': 'GitHub-Research-Project-Manager'
         })
         
+        self.pool_size = 0
+        self.ensure_pool_size(pool_size)
+        
+        # Blob shas known to exist per 'org/repo', so identical content is uploaded once per run
+        self._known_blobs: Dict[str, set] = {}
+        # Label name -> GraphQL node id per 'org/repo', for batched issue creation
+        self._label_ids: Dict[str, Dict[str, str]] = {}
+        self._label_lock = threading.Lock()
+        # One lock per 'org/repo' so concurrent commits take turns moving the branch ref
+        self._ref_locks: Dict[str, threading.Lock] = {}
+        self._ref_locks_guard = threading.Lock()
+        # Last (commit sha, tree sha) per 'org/repo', so the head we just committed
+        # needs no lookup; commits never change, so a hit is always valid
+        self._last_commit_tree: Dict[str, tuple] = {}
+        
         # Rate limiting
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = datetime.now() + timedelta(hours=1)
+        self.rate_limit_threshold = 50
+        self.max_retries = 6
+        self.backoff_base = 1.0
+        self.request_count = 0  # Requests sent, including retries
+        self.throttle_count = 0  # Responses rejected by primary or secondary rate limits
         self.check_rate_limit()
     
-    # def check_rate_limit(self):
-    #     """Check current rate limit status"""
-    #     try:
-    #         response = self.session.get(f"{self.base_url}/rate_limit")
-    #         if response.status_code == 200:
-    #             data = response.json()
-    #             if data and 'resources' in data and 'core' in data['resources']:
-    #                 core_limit = data['resources']['core']
-    #                 self.rate_limit_remaining = core_limit['remaining']
-    #                 self.rate_limit_reset = datetime.fromtimestamp(core_limit['reset'])
-    #                 logger.info(f"Rate limit: {self.rate_limit_remaining} requests remaining")
-    #             else:
-    #                 logger.warning("Rate limit response missing expected data structure")
-    #         else:
-    #             logger.warning(f"Rate limit check returned status {response.status_code}")
-    #     except Exception as e:
-    #         logger.warning(f"Could not check rate limit: {e}")
+    def ensure_pool_size(self, pool_size: int):
+        """Keep at least pool_size keep-alive connections so concurrent workers never drop them"""
+        if pool_size <= self.pool_size:
+            return
+        
+        # Transient 5xx are retried here, rate limits are handled in make_request
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504], respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.pool_size = pool_size
+    
     def check_rate_limit(self):
         """Check current rate limit status"""
         try:
             response = self.session.get(f"{self.base_url}/rate_limit")
             if response.status_code == 200:
-                data = response.json()
+                data = load_json(response.content)
                 if data and 'resources' in data and 'core' in data['resources']:
                     core_limit = data['resources']['core']
                     self.rate_limit_remaining = core_limit['remaining']
@@ -70,32 +112,109 @@ class GitHubClient:
             self.rate_limit_remaining = 1000
 
     def wait_for_rate_limit(self):
-        """Wait if rate limit is exceeded"""
-        if self.rate_limit_remaining < 100:
+        """Pace requests when the remaining quota runs low, wait for reset once it is gone"""
+        if self.rate_limit_remaining < self.rate_limit_threshold:
             wait_time = (self.rate_limit_reset - datetime.now()).total_seconds()
-            if wait_time > 0:
-                logger.warning(f"Rate limit low, waiting {wait_time:.0f} seconds")
+            if wait_time <= 0:
+                return
+            
+            if self.rate_limit_remaining <= 0:
+                logger.warning(f"Rate limit exhausted, waiting {wait_time:.0f} seconds")
                 time.sleep(min(wait_time, 3600))  # Max 1 hour wait
                 self.check_rate_limit()
+            else:
+                # Spread the remaining calls evenly over the rest of the window
+                time.sleep(wait_time / self.rate_limit_remaining)
     
-    def make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make HTTP request with rate limiting"""
-        self.wait_for_rate_limit()
+    def update_rate_limit(self, response: requests.Response):
+        """Track quota from the X-RateLimit-* response headers"""
+        if 'X-RateLimit-Remaining' in response.headers:
+            self.rate_limit_remaining = int(response.headers['X-RateLimit-Remaining'])
+        if 'X-RateLimit-Reset' in response.headers:
+            self.rate_limit_reset = datetime.fromtimestamp(int(response.headers['X-RateLimit-Reset']))
+    
+    def is_throttled(self, response: requests.Response) -> bool:
+        """Check if response is a primary or secondary rate limit rejection"""
+        if response.status_code == 429:
+            return True
+        if response.status_code == 403:
+            return (response.headers.get('X-RateLimit-Remaining') == '0'
+                    or 'Retry-After' in response.headers
+                    or 'rate limit' in response.text.lower())
+        return False
+    
+    def get_backoff_delay(self, response: requests.Response, attempt: int) -> float:
+        """Get wait time before retrying a throttled request"""
+        if 'Retry-After' in response.headers:
+            return float(response.headers['Retry-After'])
+        
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            wait_time = (self.rate_limit_reset - datetime.now()).total_seconds()
+            if wait_time > 0:
+                return min(wait_time + 1, 3600)
         
+        # Exponential backoff with jitter
+        return min(self.backoff_base * (2 ** attempt) + random.uniform(0, 1), 60)
+    
+    def make_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Make HTTP request with rate limiting and backoff on throttling"""
         full_url = f"{self.base_url}/{url.lstrip('/')}"
         
-        try:
-            response = self.session.request(method, full_url, **kwargs)
-            
-            # Update rate limit info
-            if 'X-RateLimit-Remaining' in response.headers:
-                self.rate_limit_remaining = int(response.headers['X-RateLimit-Remaining'])
+        # Encode the body once, it is resent unchanged on every retry
+        if 'json' in kwargs:
+            kwargs['data'] = dump_json(kwargs.pop('json'))
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), 'Content-Type': 'application/json'}
+        
+        for attempt in range(self.max_retries + 1):
+            self.wait_for_rate_limit()
             
-            return response
+            try:
+                response = self.session.request(method, full_url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Request failed: {e}")
+                raise
+            
+            self.request_count += 1
+            self.update_rate_limit(response)
+            
+            if not self.is_throttled(response):
+                return response
+            
+            self.throttle_count += 1
+            delay = self.get_backoff_delay(response, attempt)
+            if attempt == self.max_retries:
+                raise RateLimitExceeded(
+                    f"Rate limited on {method} {url} ({response.status_code}) after {self.max_retries} retries",
+                    retry_after=delay
+                )
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise
+            logger.warning(f"Rate limited on {method} {url} ({response.status_code}), retrying in {delay:.1f} seconds")
+            time.sleep(delay)
+    
+    def cached_get(self, url: str, params: Dict = None) -> tuple:
+        """Conditional GET using cached ETags, returns (status_code, json_body)"""
+        cache_key = self.cache.key(f"{self.base_url}/{url.lstrip('/')}", params)
+        entry = self.cache.get(cache_key)
+        
+        if entry and self.cache.is_fresh(entry):
+            return 200, entry['body']
+        
+        headers = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else {}
+        response = self.make_request('GET', url, params=params, headers=headers)
+        
+        # 304 carries no body and is not charged against the rate limit
+        if response.status_code == 304 and entry:
+            return 200, entry['body']
+        
+        if response.status_code == 200:
+            body = load_json(response.content)
+            self.cache.set(cache_key, response.headers.get('ETag'), body)
+            return 200, body
+        
+        if response.status_code == 404:
+            self.cache.invalidate(cache_key)
+        
+        return response.status_code, None
     
     def create_repository(self, org: str, repo_name: str, description: str = "", private: bool = True) -> bool:
         """Create a repository in organization"""
@@ -119,6 +238,8 @@ class GitHubClient:
                 logger.error(f"Failed to create repository {repo_name}: {response.status_code} - {response.text}")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating repository {repo_name}: {e}")
             return False
@@ -126,14 +247,16 @@ class GitHubClient:
     def get_repository(self, org: str, repo: str) -> Optional[Dict]:
         """Get repository information"""
         try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}')
+            status_code, data = self.cached_get(f'/repos/{org}/{repo}')
             
-            if response.status_code == 200:
-                return response.json()
+            if status_code == 200:
+                return data
             else:
                 logger.error(f"Repository not found: {org}/{repo}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error getting repository {org}/{repo}: {e}")
             return None
@@ -141,14 +264,16 @@ class GitHubClient:
     def list_milestones(self, org: str, repo: str, state: str = 'open') -> List[Dict]:
         """List milestones in repository"""
         try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}/milestones', params={'state': state})
+            status_code, data = self.cached_get(f'/repos/{org}/{repo}/milestones', params={'state': state})
             
-            if response.status_code == 200:
-                return response.json()
+            if status_code == 200:
+                return data
             else:
-                logger.error(f"Failed to list milestones: {response.status_code}")
+                logger.error(f"Failed to list milestones: {status_code}")
                 return []
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error listing milestones: {e}")
             return []
@@ -166,6 +291,8 @@ class GitHubClient:
             # Fix: Pass all required parameters including sha=None
             return self.update_repository_file(org, repo, gitkeep_path, content, message, sha=None)
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating directory {path}: {e}")
             return False
@@ -195,7 +322,7 @@ class GitHubClient:
             response = self.make_request('POST', f'/repos/{org}/{repo}/milestones', json=data)
             
             if response.status_code == 201:
-                milestone_data = response.json()
+                milestone_data = load_json(response.content)
                 logger.debug(f"Created milestone: {title}")
                 return milestone_data['number']
             elif response.status_code == 422:
@@ -210,6 +337,8 @@ class GitHubClient:
                 logger.error(f"Failed to create milestone: {response.status_code} - {response.text}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating milestone: {e}")
             return None
@@ -225,13 +354,15 @@ class GitHubClient:
             response = self.make_request('POST', f'/repos/{org}/{repo}/projects', json=data)
             
             if response.status_code == 201:
-                project_data = response.json()
+                project_data = load_json(response.content)
                 logger.info(f"Created repository project: {name}")
                 return project_data['id']
             else:
                 logger.error(f"Failed to create repository project: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating repository project: {e}")
             return None
@@ -242,11 +373,13 @@ class GitHubClient:
             response = self.make_request('GET', f'/projects/{project_id}/columns')
             
             if response.status_code == 200:
-                return response.json()
+                return load_json(response.content)
             else:
                 logger.error(f"Failed to list project columns: {response.status_code}")
                 return []
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error listing project columns: {e}")
             return []
@@ -267,15 +400,21 @@ class GitHubClient:
                 if response.status_code != 200:
                     break
                 
-                page_cards = response.json()
+                page_cards = load_json(response.content)
                 if not page_cards:
                     break
                 
                 cards.extend(page_cards)
+                
+                # Follow the Link header instead of probing for an empty page
+                if 'next' not in response.links:
+                    break
                 page += 1
             
             return cards
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error listing project cards: {e}")
             return []
@@ -298,26 +437,25 @@ class GitHubClient:
             if assignee:
                 params['assignee'] = assignee
             
+            # Conditional requests: unchanged pages come back as 304 and are served from cache
             while True:
-                response = self.make_request(
-                    'GET', 
-                    f'/repos/{org}/{repo}/issues',
-                    params=params
-                )
-                
-                if response.status_code != 200:
-                    break
+                status_code, page_issues = self.cached_get(f'/repos/{org}/{repo}/issues', params=params)
                 
-                page_issues = response.json()
-                if not page_issues:
+                if status_code != 200 or not page_issues:
                     break
                 
                 issues.extend(page_issues)
+                
+                # A short page is the last one, no need to fetch an empty page after it
+                if len(page_issues) < params['per_page']:
+                    break
                 page += 1
                 params['page'] = page
             
             return issues
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error listing issues: {e}")
             return []
@@ -348,6 +486,8 @@ class GitHubClient:
                 logger.error(f"Failed to add collaborator {username}: {response.status_code} - {response.text}")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error adding collaborator {username}: {e}")
             return False
@@ -371,6 +511,8 @@ class GitHubClient:
                 logger.error(f"Failed to create file: {response.status_code}")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating file: {e}")
             return False
@@ -387,43 +529,91 @@ class GitHubClient:
             response = self.make_request('POST', f'/repos/{org}/{repo}/issues', json=data)
             
             if response.status_code == 201:
-                issue_data = response.json()
+                issue_data = load_json(response.content)
                 logger.debug(f"Created issue #{issue_data['number']}: {title}")
                 return issue_data['number']
             else:
                 logger.error(f"Failed to create issue: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating issue: {e}")
             return None
     
-    ## version 1.0
-    # def create_milestone(self, org: str, repo: str, title: str, description: str = "", due_date: str = None) -> Optional[int]:
-    #     """Create milestone in repository"""
-    #     try:
-    #         data = {
-    #             'title': title,
-    #             'description': description,
-    #             'state': 'open'
-    #         }
-            
-    #         if due_date:
-    #             data['due_on'] = due_date
-            
-    #         response = self.make_request('POST', f'/repos/{org}/{repo}/milestones', json=data)
-            
-    #         if response.status_code == 201:
-    #             milestone_data = response.json()
-    #             logger.debug(f"Created milestone: {title}")
-    #             return milestone_data['number']
-    #         else:
-    #             logger.error(f"Failed to create milestone: {response.status_code}")
-    #             return None
+    def get_label_ids(self, org: str, repo: str, names: List[str]) -> Optional[Dict[str, str]]:
+        """Map label names to GraphQL node ids, creating labels that do not exist yet"""
+        key = f"{org}/{repo}"
+        with self._label_lock:
+            if key not in self._label_ids:
+                query = '''query($owner: String!, $name: String!, $cursor: String) {
+                  repository(owner: $owner, name: $name) {
+                    labels(first: 100, after: $cursor) { nodes { id name } pageInfo { hasNextPage endCursor } }
+                  }
+                }'''
+                label_ids = {}
+                cursor = None
+                while True:
+                    data = self.graphql(query, {'owner': org, 'name': repo, 'cursor': cursor})
+                    if not data or not data.get('repository'):
+                        return None
+                    connection = data['repository']['labels']
+                    label_ids.update((node['name'], node['id']) for node in connection['nodes'])
+                    if not connection['pageInfo']['hasNextPage']:
+                        break
+                    cursor = connection['pageInfo']['endCursor']
+                self._label_ids[key] = label_ids
+            
+            label_ids = self._label_ids[key]
+            for name in names:
+                if name in label_ids:
+                    continue
                 
-    #     except Exception as e:
-    #         logger.error(f"Error creating milestone: {e}")
-    #         return None
+                # REST issue creation adds missing labels implicitly, GraphQL needs them to exist
+                response = self.make_request('POST', f'/repos/{org}/{repo}/labels', json={'name': name})
+                if response.status_code != 201:
+                    logger.error(f"Failed to create label {name}: {response.status_code}")
+                    return None
+                label_ids[name] = load_json(response.content)['node_id']
+            
+            return {name: label_ids[name] for name in names}
+    
+    def create_issues_graphql(self, org: str, repo: str, issues: List[Dict]) -> Optional[List[Optional[Dict]]]:
+        """Create many {title, body, labels} issues in one GraphQL request"""
+        try:
+            repo_info = self.get_repository(org, repo)
+            label_ids = self.get_label_ids(org, repo, sorted({label for issue in issues for label in issue.get('labels', [])}))
+            if not repo_info or label_ids is None:
+                return None
+            
+            params = []
+            fields = []
+            variables = {'repositoryId': repo_info['node_id']}
+            for i, issue in enumerate(issues):
+                params.append(f'$t{i}: String!, $b{i}: String, $l{i}: [ID!]')
+                fields.append(
+                    f'm{i}: createIssue(input: {{repositoryId: $repositoryId, title: $t{i}, body: $b{i}, labelIds: $l{i}}}) '
+                    f'{{ issue {{ number title url }} }}'
+                )
+                variables.update({
+                    f't{i}': issue['title'],
+                    f'b{i}': issue.get('body', ''),
+                    f'l{i}': [label_ids[label] for label in issue.get('labels', [])]
+                })
+            mutation = f"mutation($repositoryId: ID!, {', '.join(params)}) {{ {' '.join(fields)} }}"
+            
+            data = self.graphql(mutation, variables)
+            if data is None:
+                return None
+            
+            return [((data.get(f'm{i}') or {}).get('issue')) for i in range(len(issues))]
+            
+        except RateLimitExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error creating issues: {e}")
+            return None
     
     def create_project(self, org: str, name: str, description: str = "") -> Optional[int]:
         """Create organization project"""
@@ -436,13 +626,15 @@ class GitHubClient:
             response = self.make_request('POST', f'/orgs/{org}/projects', json=data)
             
             if response.status_code == 201:
-                project_data = response.json()
+                project_data = load_json(response.content)
                 logger.info(f"Created project: {name}")
                 return project_data['id']
             else:
                 logger.error(f"Failed to create project: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating project: {e}")
             return None
@@ -455,13 +647,15 @@ class GitHubClient:
             response = self.make_request('POST', f'/projects/{project_id}/columns', json=data)
             
             if response.status_code == 201:
-                column_data = response.json()
+                column_data = load_json(response.content)
                 logger.debug(f"Created project column: {name}")
                 return column_data['id']
             else:
                 logger.error(f"Failed to create project column: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating project column: {e}")
             return None
@@ -482,13 +676,15 @@ class GitHubClient:
             response = self.make_request('POST', f'/projects/columns/{column_id}/cards', json=data)
             
             if response.status_code == 201:
-                card_data = response.json()
+                card_data = load_json(response.content)
                 logger.debug(f"Created project card")
                 return card_data['id']
             else:
                 logger.error(f"Failed to create project card: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error creating project card: {e}")
             return None
@@ -509,15 +705,21 @@ class GitHubClient:
                 if response.status_code != 200:
                     break
                 
-                page_issues = response.json()
+                page_issues = load_json(response.content)
                 if not page_issues:
                     break
                 
                 issues.extend(page_issues)
+                
+                # Follow the Link header instead of probing for an empty page
+                if 'next' not in response.links:
+                    break
                 page += 1
             
             return issues
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error getting repository issues: {e}")
             return []
@@ -528,12 +730,14 @@ class GitHubClient:
             response = self.make_request('GET', f'/search/users', params={'q': f'{email} in:email'})
             
             if response.status_code == 200:
-                data = response.json()
+                data = load_json(response.content)
                 if data['total_count'] > 0:
                     return data['items'][0]
             
             return None
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error searching user by email: {e}")
             return None
@@ -556,6 +760,8 @@ class GitHubClient:
                 logger.error(f"Failed to invite {username}: {response.status_code}")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error inviting user to organization: {e}")
             return False
@@ -565,6 +771,8 @@ class GitHubClient:
         try:
             response = self.make_request('GET', f'/repos/{org}/{repo}/collaborators/{username}')
             return response.status_code == 204
+        except RateLimitExceeded:
+            raise
         except Exception:
             return False
     
@@ -574,11 +782,13 @@ class GitHubClient:
             response = self.make_request('GET', f'/repos/{org}/{repo}/invitations')
             
             if response.status_code == 200:
-                invitations = response.json()
+                invitations = load_json(response.content)
                 return any(inv.get('invitee', {}).get('login') == username for inv in invitations)
             
             return False
             
+        except RateLimitExceeded:
+            raise
         except Exception:
             return False
     
@@ -598,15 +808,21 @@ class GitHubClient:
                 if response.status_code != 200:
                     break
                 
-                page_repos = response.json()
+                page_repos = load_json(response.content)
                 if not page_repos:
                     break
                 
                 repos.extend(page_repos)
+                
+                # Follow the Link header instead of probing for an empty page
+                if 'next' not in response.links:
+                    break
                 page += 1
             
             return repos
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error getting organization repositories: {e}")
             return []
@@ -633,659 +849,320 @@ class GitHubClient:
                 logger.error(f"Failed to update file: {response.status_code}")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error updating repository file: {e}")
             return False
     
-    def get_repository_file(self, org: str, repo: str, path: str) -> Optional[Dict]:
-        """Get file from repository"""
+    def graphql(self, query: str, variables: Dict = None) -> Optional[Dict]:
+        """Run a GraphQL query, returns the data object"""
         try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}/contents/{path}')
+            response = self.make_request('POST', '/graphql', json={'query': query, 'variables': variables or {}})
             
             if response.status_code == 200:
-                return response.json()
+                result = load_json(response.content)
+                if result.get('errors'):
+                    logger.error(f"GraphQL errors: {result['errors']}")
+                return result.get('data')
             else:
+                logger.error(f"GraphQL request failed: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error getting repository file: {e}")
+            logger.error(f"Error running GraphQL query: {e}")
             return None
-
-
-'''
-"""
-GitHub API client with rate limiting and batch operations
-"""
-
-import requests
-import time
-import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-import json
-import random
-
-logger = logging.getLogger(__name__)
-
-class GitHubClient:
-    def __init__(self, token: str, base_url: str = "https://api.github.com"):
-        self.token = token
-        self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json',
-            'User-Agent': 'GitHub-Research-Project-Manager'
-        })
-        
-        # Rate limiting
-        self.rate_limit_remaining = 15000
-        self.rate_limit_reset = datetime.now() + timedelta(hours=1)
-        
-        # Invitation-specific rate limiting
-        self.invitation_count = 0
-        self.invitation_reset_time = datetime.now()
-        self.max_invitations_per_hour = 50  # Conservative limit
-        
-        self.check_rate_limit()
-
-    def check_rate_limit(self):
-        """Check current rate limit status"""
-        try:
-            response = self.session.get(f"{self.base_url}/rate_limit")
-            if response.status_code == 200:
-                data = response.json()
-                if data and 'resources' in data and 'core' in data['resources']:
-                    core_limit = data['resources']['core']
-                    self.rate_limit_remaining = core_limit['remaining']
-                    self.rate_limit_reset = datetime.fromtimestamp(core_limit['reset'])
-                    logger.info(f"Rate limit: {self.rate_limit_remaining} requests remaining")
-                else:
-                    logger.warning("Rate limit response missing expected data structure")
-                    # Set conservative defaults if structure is unexpected
-                    self.rate_limit_remaining = 1000
-            else:
-                logger.warning(f"Rate limit check returned status {response.status_code}")
-                # Set conservative defaults on error
-                self.rate_limit_remaining = 1000
-        except Exception as e:
-            logger.warning(f"Could not check rate limit: {e}")
-            # Set conservative defaults on exception
-            self.rate_limit_remaining = 1000
-
-    def check_invitation_rate_limit(self):
-        """Check and enforce invitation-specific rate limits"""
-        now = datetime.now()
-        
-        # Reset counter every hour
-        if now > self.invitation_reset_time:
-            self.invitation_count = 0
-            self.invitation_reset_time = now + timedelta(hours=1)
-            logger.info(f"Invitation rate limit reset. Can send {self.max_invitations_per_hour} more invitations this hour")
-        
-        # Check if we're approaching the limit
-        if self.invitation_count >= self.max_invitations_per_hour:
-            wait_time = (self.invitation_reset_time - now).total_seconds()
-            logger.warning(f"Invitation rate limit reached. Waiting {wait_time:.0f} seconds until reset")
-            time.sleep(wait_time + 60)  # Wait a bit extra to be safe
-            self.invitation_count = 0
-            self.invitation_reset_time = datetime.now() + timedelta(hours=1)
-
-    def wait_for_rate_limit(self):
-        """Wait if rate limit is exceeded"""
-        if self.rate_limit_remaining < 100:
-            wait_time = (self.rate_limit_reset - datetime.now()).total_seconds()
-            if wait_time > 0:
-                logger.warning(f"Rate limit low, waiting {wait_time:.0f} seconds")
-                time.sleep(min(wait_time, 3600))  # Max 1 hour wait
-                self.check_rate_limit()
     
-    def make_request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make HTTP request with rate limiting"""
-        self.wait_for_rate_limit()
-        
-        full_url = f"{self.base_url}/{url.lstrip('/')}"
+    def list_issues_graphql(self, org: str, repo: str, labels: List[str]) -> Optional[List[Dict]]:
+        """List issues carrying any of labels, most recently updated first, in the REST issue shape"""
+        query = '''query($owner: String!, $name: String!, $labels: [String!], $cursor: String) {
+          repository(owner: $owner, name: $name) {
+            issues(first: 100, after: $cursor, labels: $labels, orderBy: {field: UPDATED_AT, direction: DESC}) {
+              nodes { number title state updatedAt labels(first: 20) { nodes { name } } }
+              pageInfo { hasNextPage endCursor }
+            }
+          }
+        }'''
+        issues = []
+        cursor = None
         
-        try:
-            response = self.session.request(method, full_url, **kwargs)
-            
-            # Update rate limit info
-            if 'X-RateLimit-Remaining' in response.headers:
-                self.rate_limit_remaining = int(response.headers['X-RateLimit-Remaining'])
+        while True:
+            data = self.graphql(query, {'owner': org, 'name': repo, 'labels': labels, 'cursor': cursor})
+            if not data or not data.get('repository'):
+                return None
             
-            return response
+            connection = data['repository']['issues']
+            issues.extend(
+                {
+                    'number': node['number'],
+                    'title': node['title'],
+                    'state': node['state'].lower(),
+                    'updated_at': node['updatedAt'],
+                    'labels': node['labels']['nodes']
+                }
+                for node in connection['nodes']
+            )
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
-            raise
+            if not connection['pageInfo']['hasNextPage']:
+                return issues
+            cursor = connection['pageInfo']['endCursor']
     
-    def create_repository(self, org: str, repo_name: str, description: str = "", private: bool = True) -> bool:
-        """Create a repository in organization"""
+    def get_tree_shas(self, org: str, repo: str, ref: str = 'HEAD') -> Optional[Dict[str, str]]:
+        """Map every file path in the repository to its blob sha with one recursive tree request"""
         try:
-            data = {
-                'name': repo_name,
-                'description': description,
-                'private': private,
-                'auto_init': True,
-                'has_issues': True,
-                'has_projects': True,
-                'has_wiki': False
-            }
-            
-            response = self.make_request('POST', f'/orgs/{org}/repos', json=data)
+            response = self.make_request('GET', f'/repos/{org}/{repo}/git/trees/{ref}', params={'recursive': '1'})
             
-            if response.status_code == 201:
-                logger.info(f"Created repository: {org}/{repo_name}")
-                return True
+            if response.status_code == 200:
+                data = load_json(response.content)
+                if data.get('truncated'):
+                    logger.warning(f"Tree listing for {org}/{repo} was truncated")
+                tree_shas = {item['path']: item['sha'] for item in data.get('tree', []) if item.get('type') == 'blob'}
+                self._known_blobs.setdefault(f"{org}/{repo}", set()).update(tree_shas.values())
+                return tree_shas
             else:
-                logger.error(f"Failed to create repository {repo_name}: {response.status_code} - {response.text}")
-                return False
+                logger.error(f"Failed to list tree of {org}/{repo}: {response.status_code}")
+                return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error creating repository {repo_name}: {e}")
-            return False
+            logger.error(f"Error listing repository tree: {e}")
+            return None
     
-    def get_repository(self, org: str, repo: str) -> Optional[Dict]:
-        """Get repository information"""
+    def get_branch_head(self, org: str, repo: str, branch: str) -> Optional[str]:
+        """Get commit sha the branch currently points to"""
         try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}')
+            # Not cached: the ref moves with every commit we make
+            response = self.make_request('GET', f'/repos/{org}/{repo}/git/ref/heads/{branch}')
             
             if response.status_code == 200:
-                return response.json()
+                return load_json(response.content)['object']['sha']
             else:
-                logger.error(f"Repository not found: {org}/{repo}")
+                logger.error(f"Failed to get ref heads/{branch}: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error getting repository {org}/{repo}: {e}")
+            logger.error(f"Error getting branch head: {e}")
             return None
     
-    def list_milestones(self, org: str, repo: str, state: str = 'open') -> List[Dict]:
-        """List milestones in repository"""
+    def get_commit_tree(self, org: str, repo: str, commit_sha: str) -> Optional[str]:
+        """Get root tree sha of a commit"""
         try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}/milestones', params={'state': state})
+            last_commit, last_tree = self._last_commit_tree.get(f"{org}/{repo}", (None, None))
+            if last_commit == commit_sha:
+                return last_tree
+            
+            response = self.make_request('GET', f'/repos/{org}/{repo}/git/commits/{commit_sha}')
             
             if response.status_code == 200:
-                return response.json()
+                tree_sha = load_json(response.content)['tree']['sha']
+                self._last_commit_tree[f"{org}/{repo}"] = (commit_sha, tree_sha)
+                return tree_sha
             else:
-                logger.error(f"Failed to list milestones: {response.status_code}")
-                return []
+                logger.error(f"Failed to get commit {commit_sha}: {response.status_code}")
+                return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error listing milestones: {e}")
-            return []
-
-    def create_directory(self, org: str, repo: str, path: str, message: str = None) -> bool:
-        """Create directory by adding a .gitkeep file"""
+            logger.error(f"Error getting commit: {e}")
+            return None
+    
+    def create_blob(self, org: str, repo: str, content: Union[str, bytes]) -> Optional[str]:
+        """Upload file content (str, or already encoded bytes) as a git blob"""
         try:
-            if not message:
-                message = f"Create directory {path}"
-            
-            # GitHub doesn't have directories without files, so create .gitkeep
-            gitkeep_path = f"{path}/.gitkeep" if not path.endswith('/') else f"{path}.gitkeep"
-            content = "# This file keeps the directory in git\n"
-            
-            # Fix: Pass all required parameters including sha=None
-            return self.update_repository_file(org, repo, gitkeep_path, content, message, sha=None)
-            
-        except Exception as e:
-            logger.error(f"Error creating directory {path}: {e}")
-            return False
+            import base64
             
-    def create_repository_file(self, org: str, repo: str, path: str, content: str, message: str) -> bool:
-        """Create or update file in repository (alias for compatibility)"""
-        return self.update_repository_file(org, repo, path, content, message)
-
-    def create_milestone(self, org: str, repo: str, title: str, description: str = "", due_date: str = None) -> Optional[int]:
-        """Create milestone in repository"""
-        try:
+            if isinstance(content, str):
+                content = content.encode('utf-8')
             data = {
-                'title': title,
-                'description': description,
-                'state': 'open'
+                'content': base64.b64encode(content).decode('ascii'),
+                'encoding': 'base64'
             }
             
-            if due_date:
-                # Convert to ISO 8601 format if needed
-                if isinstance(due_date, str):
-                    if 'T' not in due_date:
-                        due_date = due_date + 'T23:59:59Z'
-                    elif not due_date.endswith('Z'):
-                        due_date = due_date + 'Z'
-                data['due_on'] = due_date
-            
-            response = self.make_request('POST', f'/repos/{org}/{repo}/milestones', json=data)
+            response = self.make_request('POST', f'/repos/{org}/{repo}/git/blobs', json=data)
             
             if response.status_code == 201:
-                milestone_data = response.json()
-                logger.debug(f"Created milestone: {title}")
-                return milestone_data['number']
-            elif response.status_code == 422:
-                logger.warning(f"Milestone '{title}' may already exist or validation failed: {response.text}")
-                # Check if milestone exists
-                milestones = self.list_milestones(org, repo)
-                for milestone in milestones:
-                    if milestone['title'] == title:
-                        return milestone['number']
-                return None
+                blob_sha = load_json(response.content)['sha']
+                self._known_blobs.setdefault(f"{org}/{repo}", set()).add(blob_sha)
+                return blob_sha
             else:
-                logger.error(f"Failed to create milestone: {response.status_code} - {response.text}")
+                logger.error(f"Failed to create blob: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error creating milestone: {e}")
+            logger.error(f"Error creating blob: {e}")
             return None
-
-    def create_repo_project(self, org: str, repo: str, name: str, description: str = "") -> Optional[int]:
-        """Create repository project (different from organization project)"""
+    
+    def create_tree(self, org: str, repo: str, entries: List[Dict], base_tree: str = None) -> Optional[str]:
+        """Create a git tree from {path, sha} blob entries on top of base_tree"""
+        return self._create_tree(org, repo, entries, base_tree)[1]
+    
+    def _create_tree(self, org: str, repo: str, entries: List[Dict], base_tree: str = None) -> tuple:
+        """Create a git tree, returns (status_code, tree_sha)"""
         try:
             data = {
-                'name': name,
-                'body': description
+                'tree': [
+                    {'path': entry['path'], 'mode': '100644', 'type': 'blob', 'sha': entry['sha']}
+                    for entry in entries
+                ]
             }
             
-            response = self.make_request('POST', f'/repos/{org}/{repo}/projects', json=data)
+            if base_tree:
+                data['base_tree'] = base_tree
             
-            if response.status_code == 201:
-                project_data = response.json()
-                logger.info(f"Created repository project: {name}")
-                return project_data['id']
-            else:
-                logger.error(f"Failed to create repository project: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error creating repository project: {e}")
-            return None
-    
-    def list_project_columns(self, project_id: int) -> List[Dict]:
-        """List all columns in a project"""
-        try:
-            response = self.make_request('GET', f'/projects/{project_id}/columns')
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(f"Failed to list project columns: {response.status_code}")
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error listing project columns: {e}")
-            return []
-    
-    def list_project_cards(self, column_id: int) -> List[Dict]:
-        """List all cards in a project column"""
-        try:
-            cards = []
-            page = 1
-            
-            while True:
-                response = self.make_request(
-                    'GET', 
-                    f'/projects/columns/{column_id}/cards',
-                    params={'page': page, 'per_page': 100}
-                )
-                
-                if response.status_code != 200:
-                    break
-                
-                page_cards = response.json()
-                if not page_cards:
-                    break
-                
-                cards.extend(page_cards)
-                page += 1
-            
-            return cards
-            
-        except Exception as e:
-            logger.error(f"Error listing project cards: {e}")
-            return []
-    
-    def list_issues(self, org: str, repo: str, state: str = 'all', labels: List[str] = None, assignee: str = None) -> List[Dict]:
-        """List issues with filtering options"""
-        try:
-            issues = []
-            page = 1
-            
-            params = {
-                'state': state,
-                'page': page,
-                'per_page': 100
-            }
-            
-            if labels:
-                params['labels'] = ','.join(labels)
-            
-            if assignee:
-                params['assignee'] = assignee
-            
-            while True:
-                response = self.make_request(
-                    'GET', 
-                    f'/repos/{org}/{repo}/issues',
-                    params=params
-                )
-                
-                if response.status_code != 200:
-                    break
-                
-                page_issues = response.json()
-                if not page_issues:
-                    break
-                
-                issues.extend(page_issues)
-                page += 1
-                params['page'] = page
-            
-            return issues
-            
-        except Exception as e:
-            logger.error(f"Error listing issues: {e}")
-            return []
-
-    def add_collaborator(self, org: str, repo: str, username: str, permission: str = 'push') -> bool:
-        """Add collaborator to repository with enhanced rate limiting and retry logic"""
-        max_retries = 3
-        base_delay = 60  # Start with 1 minute delay
-        
-        for attempt in range(max_retries):
-            try:
-                # Check invitation rate limit before attempting
-                self.check_invitation_rate_limit()
-                
-                # Add random delay between requests to avoid hitting limits
-                if attempt > 0 or self.invitation_count > 0:
-                    delay = random.uniform(30, 90)  # Random delay between 30-90 seconds
-                    logger.info(f"Waiting {delay:.0f} seconds before invitation attempt {attempt + 1}")
-                    time.sleep(delay)
-                
-                data = {'permission': permission}
-                
-                response = self.make_request(
-                    'PUT', 
-                    f'/repos/{org}/{repo}/collaborators/{username}',
-                    json=data
-                )
-                
-                if response.status_code in [201, 204]:
-                    logger.debug(f"Added {username} as collaborator to {org}/{repo}")
-                    self.invitation_count += 1
-                    return True
-                    
-                elif response.status_code == 422:
-                    error_data = response.json() if response.content else {}
-                    
-                    if 'rate_limit' in str(error_data).lower():
-                        # Rate limit exceeded - implement exponential backoff
-                        wait_time = base_delay * (2 ** attempt)
-                        max_wait = min(wait_time, 900)  # Cap at 15 minutes
-                        
-                        logger.warning(f"Rate limit exceeded for invitations. Attempt {attempt + 1}/{max_retries}. Waiting {max_wait} seconds...")
-                        time.sleep(max_wait)
-                        
-                        if attempt == max_retries - 1:
-                            logger.error(f"Failed to add collaborator {username} after {max_retries} attempts due to rate limiting")
-                            return False
-                        continue
-                    else:
-                        logger.error(f"Failed to add collaborator {username}: {response.status_code} - {response.text}")
-                        return False
-                        
-                elif response.status_code == 404:
-                    # Check if it's user not found vs repository not found
-                    user_check = self.make_request('GET', f'/users/{username}')
-                    if user_check.status_code == 404:
-                        logger.error(f"User '{username}' does not exist on GitHub")
-                    else:
-                        logger.error(f"Repository '{org}/{repo}' not found or insufficient permissions")
-                    return False
-                else:
-                    logger.error(f"Failed to add collaborator {username}: {response.status_code} - {response.text}")
-                    return False
-                    
-            except Exception as e:
-                logger.error(f"Error adding collaborator {username} (attempt {attempt + 1}): {e}")
-                if attempt == max_retries - 1:
-                    return False
-                time.sleep(base_delay * (attempt + 1))
-        
-        return False
-
-    def create_file(self, org: str, repo: str, path: str, message: str, content: str) -> bool:
-        """Create file in repository"""
-        try:
-            import base64
-            
-            data = {
-                'message': message,
-                'content': base64.b64encode(content.encode()).decode()
-            }
-            
-            response = self.make_request('PUT', f'/repos/{org}/{repo}/contents/{path}', json=data)
+            response = self.make_request('POST', f'/repos/{org}/{repo}/git/trees', json=data)
             
             if response.status_code == 201:
-                logger.debug(f"Created file {path} in {org}/{repo}")
-                return True
+                return 201, load_json(response.content)['sha']
             else:
-                logger.error(f"Failed to create file: {response.status_code}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error creating file: {e}")
-            return False
-
-    def create_issue(self, org: str, repo: str, title: str, body: str, labels: List[str] = None) -> Optional[int]:
-        """Create an issue in repository"""
-        try:
-            data = {
-                'title': title,
-                'body': body,
-                'labels': labels or []
-            }
-            
-            response = self.make_request('POST', f'/repos/{org}/{repo}/issues', json=data)
-            
-            if response.status_code == 201:
-                issue_data = response.json()
-                logger.debug(f"Created issue #{issue_data['number']}: {title}")
-                return issue_data['number']
-            else:
-                logger.error(f"Failed to create issue: {response.status_code}")
-                return None
+                logger.error(f"Failed to create tree: {response.status_code} - {response.text}")
+                return response.status_code, None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error creating issue: {e}")
-            return None
+            logger.error(f"Error creating tree: {e}")
+            return None, None
     
-    def create_project(self, org: str, name: str, description: str = "") -> Optional[int]:
-        """Create organization project"""
+    def create_commit(self, org: str, repo: str, message: str, tree_sha: str, parents: List[str]) -> Optional[str]:
+        """Create a git commit object"""
         try:
             data = {
-                'name': name,
-                'body': description
+                'message': message,
+                'tree': tree_sha,
+                'parents': parents
             }
             
-            response = self.make_request('POST', f'/orgs/{org}/projects', json=data)
+            response = self.make_request('POST', f'/repos/{org}/{repo}/git/commits', json=data)
             
             if response.status_code == 201:
-                project_data = response.json()
-                logger.info(f"Created project: {name}")
-                return project_data['id']
+                return load_json(response.content)['sha']
             else:
-                logger.error(f"Failed to create project: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error creating project: {e}")
-            return None
-    
-    def create_project_column(self, project_id: int, name: str) -> Optional[int]:
-        """Create column in project"""
-        try:
-            data = {'name': name}
-            
-            response = self.make_request('POST', f'/projects/{project_id}/columns', json=data)
-            
-            if response.status_code == 201:
-                column_data = response.json()
-                logger.debug(f"Created project column: {name}")
-                return column_data['id']
-            else:
-                logger.error(f"Failed to create project column: {response.status_code}")
+                logger.error(f"Failed to create commit: {response.status_code}")
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error creating project column: {e}")
+            logger.error(f"Error creating commit: {e}")
             return None
     
-    def create_project_card(self, column_id: int, content_id: int = None, content_type: str = 'Issue', note: str = None) -> Optional[int]:
-        """Create card in project column"""
+    def update_branch_head(self, org: str, repo: str, branch: str, commit_sha: str) -> bool:
+        """Fast-forward branch to commit, False if the branch moved meanwhile"""
         try:
-            data = {}
-            
-            if content_id and content_type:
-                data['content_id'] = content_id
-                data['content_type'] = content_type
-            elif note:
-                data['note'] = note
-            else:
-                raise ValueError("Either content_id/content_type or note must be provided")
-            
-            response = self.make_request('POST', f'/projects/columns/{column_id}/cards', json=data)
-            
-            if response.status_code == 201:
-                card_data = response.json()
-                logger.debug(f"Created project card")
-                return card_data['id']
-            else:
-                logger.error(f"Failed to create project card: {response.status_code}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error creating project card: {e}")
-            return None
-    
-    def get_repository_issues(self, org: str, repo: str, state: str = 'all') -> List[Dict]:
-        """Get all issues from repository"""
-        try:
-            issues = []
-            page = 1
-            
-            while True:
-                response = self.make_request(
-                    'GET', 
-                    f'/repos/{org}/{repo}/issues',
-                    params={'state': state, 'page': page, 'per_page': 100}
-                )
-                
-                if response.status_code != 200:
-                    break
-                
-                page_issues = response.json()
-                if not page_issues:
-                    break
-                
-                issues.extend(page_issues)
-                page += 1
-            
-            return issues
-            
-        except Exception as e:
-            logger.error(f"Error getting repository issues: {e}")
-            return []
-    
-    def search_user_by_email(self, email: str) -> Optional[Dict]:
-        """Search for GitHub user by email"""
-        try:
-            response = self.make_request('GET', f'/search/users', params={'q': f'{email} in:email'})
+            response = self.make_request('PATCH', f'/repos/{org}/{repo}/git/refs/heads/{branch}',
+                                         json={'sha': commit_sha, 'force': False})
             
             if response.status_code == 200:
-                data = response.json()
-                if data['total_count'] > 0:
-                    return data['items'][0]
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error searching user by email: {e}")
-            return None
-    
-    def invite_to_organization(self, org: str, username: str, role: str = 'member') -> bool:
-        """Invite user to organization"""
-        try:
-            data = {'role': role}
-            
-            response = self.make_request(
-                'PUT',
-                f'/orgs/{org}/memberships/{username}',
-                json=data
-            )
-            
-            if response.status_code in [200, 201]:
-                logger.debug(f"Invited {username} to organization {org}")
                 return True
             else:
-                logger.error(f"Failed to invite {username}: {response.status_code}")
+                logger.debug(f"Ref heads/{branch} not updated: {response.status_code}")
                 return False
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error inviting user to organization: {e}")
+            logger.error(f"Error updating branch head: {e}")
             return False
     
-    def check_collaborator(self, org: str, repo: str, username: str) -> bool:
-        """Check if user is collaborator"""
-        try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}/collaborators/{username}')
-            return response.status_code == 204
-        except Exception:
-            return False
+    def forget_repository(self, org: str, repo: str):
+        """Drop everything remembered about a repository, e.g. after deleting it"""
+        self._known_blobs.pop(f"{org}/{repo}", None)
+        self._last_commit_tree.pop(f"{org}/{repo}", None)
+        with self._label_lock:
+            self._label_ids.pop(f"{org}/{repo}", None)
     
-    def check_pending_invitation(self, org: str, repo: str, username: str) -> bool:
-        """Check if user has pending invitation"""
-        try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}/invitations')
-            
-            if response.status_code == 200:
-                invitations = response.json()
-                return any(inv.get('invitee', {}).get('login') == username for inv in invitations)
-            
-            return False
-            
-        except Exception:
+    def _upload_blobs(self, org: str, repo: str, blobs: Dict[str, bytes], max_workers: int) -> bool:
+        """Upload {sha: content} blobs in parallel, False if any upload failed or hashed differently"""
+        if not blobs:
+            return True
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(blobs)))) as executor:
+            uploaded = dict(zip(blobs, executor.map(lambda content: self.create_blob(org, repo, content), blobs.values())))
+        
+        if any(uploaded.get(sha) != sha for sha in blobs):
+            logger.error(f"Blob upload failed or sha mismatch for {org}/{repo}")
             return False
+        return True
     
-    def get_organization_repositories(self, org: str) -> List[Dict]:
-        """Get all repositories in organization"""
+    def _ref_lock(self, org: str, repo: str) -> threading.Lock:
+        """Lock serializing branch ref updates for one repository"""
+        with self._ref_locks_guard:
+            return self._ref_locks.setdefault(f"{org}/{repo}", threading.Lock())
+    
+    def commit_files(self, org: str, repo: str, files: List[tuple], message: str, branch: str = None,
+                     max_workers: int = 8) -> bool:
+        """Commit many (path, content) files as a single commit using the Git Data API"""
         try:
-            repos = []
-            page = 1
+            if not branch:
+                repo_info = self.get_repository(org, repo)
+                branch = (repo_info or {}).get('default_branch', 'main')
+            
+            # Blob shas are computed locally (git's own hashing, which GitHub shares); each
+            # distinct content is uploaded at most once per run and reused across paths.
+            # Content is UTF-8 encoded once here and the same bytes go into the upload
+            encoded = [(path, content.encode('utf-8')) for path, content in files]
+            entries = [{'path': path, 'sha': git_blob_sha(data)} for path, data in encoded]
+            blobs = {entry['sha']: data for entry, (_, data) in zip(entries, encoded)}
+            known_blobs = self._known_blobs.setdefault(f"{org}/{repo}", set())
+            skipped_uploads = any(sha in known_blobs for sha in blobs)
+            if not self._upload_blobs(org, repo, {sha: data for sha, data in blobs.items() if sha not in known_blobs}, max_workers):
+                return False
             
-            while True:
-                response = self.make_request(
-                    'GET',
-                    f'/orgs/{org}/repos',
-                    params={'page': page, 'per_page': 100, 'type': 'all'}
-                )
-                
-                if response.status_code != 200:
-                    break
-                
-                page_repos = response.json()
-                if not page_repos:
-                    break
-                
-                repos.extend(page_repos)
-                page += 1
+            # Blobs upload in parallel above; head -> tree -> commit -> ref runs one commit at a time
+            # per repository. Writers outside this client can still move the branch, so rebuild on
+            # the new head if the ref update is rejected
+            with self._ref_lock(org, repo):
+                for attempt in range(5):
+                    head_sha = self.get_branch_head(org, repo, branch)
+                    base_tree = self.get_commit_tree(org, repo, head_sha) if head_sha else None
+                    if not base_tree:
+                        return False
+                    
+                    tree_status, tree_sha = self._create_tree(org, repo, entries, base_tree=base_tree)
+                    if tree_status == 422 and skipped_uploads:
+                        # A blob we believed was there is missing (e.g. the repository was
+                        # recreated), so stop trusting the known set and upload everything once
+                        logger.warning(f"Known blobs of {org}/{repo} are stale, re-uploading")
+                        self._known_blobs.pop(f"{org}/{repo}", None)
+                        skipped_uploads = False
+                        if not self._upload_blobs(org, repo, blobs, max_workers):
+                            return False
+                        tree_status, tree_sha = self._create_tree(org, repo, entries, base_tree=base_tree)
+                    
+                    if tree_sha == base_tree:
+                        # Every file already has this content, nothing to commit
+                        return True
+                    
+                    commit_sha = self.create_commit(org, repo, message, tree_sha, [head_sha]) if tree_sha else None
+                    if not commit_sha:
+                        return False
+                    
+                    if self.update_branch_head(org, repo, branch, commit_sha):
+                        self._last_commit_tree[f"{org}/{repo}"] = (commit_sha, tree_sha)
+                        logger.debug(f"Committed {len(entries)} files to {org}/{repo}@{branch}")
+                        return True
+                    
+                    time.sleep(random.uniform(0, 0.5 * (attempt + 1)))
             
-            return repos
+            logger.error(f"Gave up committing to {org}/{repo}@{branch}: branch kept moving")
+            return False
             
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error getting organization repositories: {e}")
-            return []
+            logger.error(f"Error committing files: {e}")
+            return False
     
-    def update_repository_file(self, org: str, repo: str, path: str, content: str, message: str, sha: str = None) -> bool:
-        """Create or update file in repository"""
+    def put_file(self, org: str, repo: str, path: str, content: str, message: str, sha: str = None) -> tuple:
+        """Create or update file without probing first, returns (status_code, new_blob_sha)"""
         try:
             import base64
             
@@ -1300,37 +1177,44 @@ class GitHubClient:
             response = self.make_request('PUT', f'/repos/{org}/{repo}/contents/{path}', json=data)
             
             if response.status_code in [200, 201]:
-                logger.debug(f"Updated file {path} in {org}/{repo}")
-                return True
-            else:
-                logger.error(f"Failed to update file: {response.status_code}")
-                return False
+                logger.debug(f"Wrote file {path} in {org}/{repo}")
+                return response.status_code, load_json(response.content).get('content', {}).get('sha')
+            
+            # 422 on create means the file already exists and needs its sha
+            if response.status_code != 422:
+                logger.error(f"Failed to write file: {response.status_code}")
+            return response.status_code, None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
-            logger.error(f"Error updating repository file: {e}")
-            return False
+            logger.error(f"Error writing repository file: {e}")
+            return None, None
     
     def get_repository_file(self, org: str, repo: str, path: str) -> Optional[Dict]:
         """Get file from repository"""
         try:
-            response = self.make_request('GET', f'/repos/{org}/{repo}/contents/{path}')
+            status_code, data = self.cached_get(f'/repos/{org}/{repo}/contents/{path}')
             
-            if response.status_code == 200:
-                return response.json()
+            if status_code == 200:
+                return data
             else:
                 return None
                 
+        except RateLimitExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error getting repository file: {e}")
             return None
 
-    def get_invitation_status(self) -> Dict[str, Any]:
-        """Get current invitation status and limits"""
-        return {
-            'invitations_sent_this_hour': self.invitation_count,
-            'max_per_hour': self.max_invitations_per_hour,
-            'remaining_this_hour': self.max_invitations_per_hour - self.invitation_count,
-            'reset_time': self.invitation_reset_time.isoformat(),
-            'general_rate_limit': self.rate_limit_remaining
-        }
-'''
\ No newline at end of file
+# One client per token for the whole process, so every manager shares the
+# pooled session, response cache and rate-limit accounting
+_clients: Dict[str, GitHubClient] = {}
+_clients_lock = threading.Lock()
+
+def get_github_client(token: str) -> GitHubClient:
+    """Get the shared GitHubClient for a token, creating it on first use"""
+    with _clients_lock:
+        if token not in _clients:
+            _clients[token] = GitHubClient(token)
+        return _clients[token]
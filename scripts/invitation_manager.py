@@ -5,7 +5,7 @@ project invitation automation and access management
 import logging
 import time
 from typing import Dict, List, Optional, Tuple
-from .github_client import GitHubClient
+from .github_client import get_github_client
 from .utils import load_project_data, load_supervisor_data, extract_github_username
 
 logger = logging.getLogger(__name__)
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 class InvitationManager:
     def __init__(self, config: Dict):
         self.config = config
-        self.github = GitHubClient(config['github']['token'])
+        self.github = get_github_client(config['github']['token'])
         self.org = config['github']['organization']
         
     def send_bulk_student_invitations(self, project_csv_path: str) -> Dict:
@@ -5,15 +5,36 @@ Master project dashboard management for GitHub Projects
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
-from .github_client import GitHubClient
-from .utils import load_project_data, load_supervisor_data
+from .github_client import get_github_client
+from .utils import load_project_data, load_supervisor_data, project_folder_name
 
 logger = logging.getLogger(__name__)
 
+# Project board card body, one per student
+_STUDENT_CARD_TEMPLATE = """**{index_number}** - {research_area}
+
+👤 **Student:** {github_username}
+📂 **Folder:** `projects/{folder_name}/`
+📧 **Email:** {email}
+
+**Quick Links:**
+- [Student Folder](projects/{folder_name}/)
+- [Issues](issues?q=label%3Astudent-{index_number})
+- [Progress Reports](projects/{folder_name}/docs/progress_reports/)
+
+**Milestones:**
+- [ ] Research Proposal (Week 4)
+- [ ] Literature Review (Week 5) 
+- [ ] Implementation (Week 8)
+- [ ] Final Evaluation (Week 12)
+
+**Last Updated:** {today}
+"""
+
 class MasterProjectManager:
     def __init__(self, config: Dict):
         self.config = config
-        self.github = GitHubClient(config['github']['token'])
+        self.github = get_github_client(config['github']['token'])
         self.org = config['github']['organization']
         self.repo_name = config['repository']['name']
         self.dashboard_config = config.get('master_dashboard', {})
@@ -167,7 +188,7 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                         'student': student,
                         'card_id': card_id,
                         'column': initial_column,
-                        'folder_path': f"projects/{student['index_number']}-{student['research_area'].replace(' ', '-')}"
+                        'folder_path': f"projects/{project_folder_name(student)}"
                     })
                     logger.debug(f"Created card for student {student['index_number']}")
                 
@@ -184,27 +205,14 @@ Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
     def _generate_student_card_content(self, student: Dict) -> str:
         """Generate content for student project card"""
-        folder_name = f"{student['index_number']}-{student['research_area'].replace(' ', '-')}"
-        
-        return f"""**{student['index_number']}** - {student['research_area']}
-
-👤 **Student:** {student.get('github_username', 'N/A')}
-📂 **Folder:** `projects/{folder_name}/`
-📧 **Email:** {student.get('email', 'N/A')}
-
-**Quick Links:**
-- [Student Folder](projects/{folder_name}/)
-- [Issues](issues?q=label%3Astudent-{student['index_number']})
-- [Progress Reports](projects/{folder_name}/docs/progress_reports/)
-
-**Milestones:**
-- [ ] Research Proposal (Week 4)
-- [ ] Literature Review (Week 5) 
-- [ ] Implementation (Week 8)
-- [ ] Final Evaluation (Week 12)
-
-**Last Updated:** {datetime.now().strftime('%Y-%m-%d')}
-"""
+        return _STUDENT_CARD_TEMPLATE.format_map({
+            'index_number': student['index_number'],
+            'research_area': student['research_area'],
+            'github_username': student.get('github_username', 'N/A'),
+            'email': student.get('email', 'N/A'),
+            'folder_name': project_folder_name(student),
+            'today': datetime.now().strftime('%Y-%m-%d')
+        })
 
     def update_master_dashboard(self, project_id: int, progress_data: Dict) -> Dict:
         """Update master dashboard with current progress data"""
@@ -6,7 +6,7 @@ import logging
 import json
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from .github_client import GitHubClient
+from .github_client import get_github_client
 from .utils import (
     load_project_data, generate_repo_name, save_progress_data, 
     load_progress_data, calculate_progress_percentage, get_milestone_status
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 class ProgressAggregator:
     def __init__(self, config: Dict):
         self.config = config
-        self.github = GitHubClient(config['github']['token'])
+        self.github = get_github_client(config['github']['token'])
         self.org = config['github']['organization']
     
     def collect_all_progress(self, project_csv_path: str) -> Dict:
@@ -284,7 +284,7 @@ class ProgressAggregator:
             save_progress_data(report, f'weekly_report_{timestamp}.json', 'data/reports/weekly_reports')
             
             # Save current data as previous for next week
-            save_progress_data(current_progress, 'weekly_report_previous.json')
+            save_progress_data(current_progress, 'weekly_report_previous.json', pretty=False)
             
             logger.info("Weekly report generated successfully")
             return report
@@ -429,7 +429,7 @@ class ProgressAggregator:
         try:
             # This would integrate with master_project.py
             # For now, save progress data that can be used by master dashboard
-            save_progress_data(progress_data, 'master_dashboard_data.json')
+            save_progress_data(progress_data, 'master_dashboard_data.json', pretty=False)
             
             logger.info("Progress data saved for master dashboard update")
             return True
@@ -2,39 +2,140 @@
 Single repository creation and management with project folders
 """
 
+import hashlib
+import json
 import logging
 import os
+import re
 import time
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Dict, List, Optional, Any, Iterable, Iterator
+from collections import deque
 from datetime import datetime, timedelta
-from .github_client import GitHubClient
-from .utils import load_project_data, generate_repo_name, batch_process
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from .github_client import get_github_client
+from .utils import iter_project_data, generate_repo_name, git_blob_sha, folder_slug, project_folder_name
 
 logger = logging.getLogger(__name__)
 
+# Template placeholders look like {STUDENT_INDEX}; lowercase braces are literal text
+_SUB_RE = re.compile(r'\{([A-Z_][A-Z0-9_]*)\}')
+
+# Templates the repository scaffold and student folders are built from
+_EXPECTED_TEMPLATES = (
+    'repository/main_readme.md', 'repository/.gitignore', 'repository/requirements.txt',
+    'repository/projects_readme.md', 'documentation/project_overview.md',
+    'documentation/project_guidelines.md', 'documentation/supervisor_guide.md',
+    'issues/progress_report.md', 'issues/milestone_submission.md',
+    'project/project_readme.md', 'project/research_proposal.md', 'project/literature_review.md',
+    'project/methodology.md', 'project/requirements.txt', 'project/usage_instructions.md'
+)
+
+@lru_cache(maxsize=None)
+def _load_templates(templates_dir: str) -> Dict[str, str]:
+    """Read every template under templates_dir once, keyed by '/'-separated relative path"""
+    templates = {}
+    
+    for root, _, files in os.walk(templates_dir):
+        for filename in files:
+            full_path = os.path.join(root, filename)
+            rel_path = os.path.relpath(full_path, templates_dir).replace(os.sep, '/')
+            with open(full_path, 'r', encoding='utf-8') as f:
+                templates[rel_path] = f.read()
+    
+    missing = [path for path in _EXPECTED_TEMPLATES if path not in templates]
+    if missing:
+        logger.warning(f"Templates not found in {templates_dir}: {', '.join(missing)}")
+    
+    return templates
+
+@lru_cache(maxsize=None)
+def _template_parts(content: str) -> tuple:
+    """Split a template once into literal text (even indexes) and placeholder names (odd indexes)"""
+    return tuple(_SUB_RE.split(content))
+
 class RepositoryManager:
+    # Student file content that never depends on the student
+    _STATIC_CONTENT = {
+        '.gitkeep': "# This file keeps the directory in git\n# You can delete this file once you add other files to this directory\n"
+    }
+    # Files every student folder starts with, relative to projects/<folder>/,
+    # with the generator for per-student content (None for static files)
+    _STUDENT_LAYOUT = (
+        ('README.md', 'generate_project_readme'),
+        ('docs/research_proposal.md', 'generate_proposal_template'),
+        ('docs/literature_review.md', 'generate_literature_review_template'),
+        ('docs/methodology.md', 'generate_methodology_template'),
+        ('docs/usage_instructions.md', None),
+        ('docs/progress_reports/.gitkeep', None),
+        ('src/.gitkeep', None),
+        ('data/.gitkeep', None),
+        ('experiments/.gitkeep', None),
+        ('results/.gitkeep', None),
+        ('requirements.txt', None)
+    )
+    # File name -> generator method, for looking up a single student file
+    _STUDENT_FILE_HANDLERS = {rel_path.rsplit('/', 1)[-1]: method_name for rel_path, method_name in _STUDENT_LAYOUT}
+    
     def __init__(self, config: Dict):
         self.config = config
-        self.github = GitHubClient(config['github']['token'])
+        self.github = get_github_client(config['github']['token'])
         self.org = config['github']['organization']
-        self.templates_dir = '/home/oshadi/research_workspace/In21-S7-CS4681-Project-Management/templates'
+        self.templates_dir = config.get('templates', {}).get('template_directory', 'templates')
+        self._templates = _load_templates(self.templates_dir)
         self.main_repo_name = config.get('project', {}).get('main_project_name', 'In21-S7-CS4681-AML-Research-Projects')
         self.logger = logging.getLogger(__name__)
+        
+        # One clock reading per run so dates agree across every file and milestone
+        self._run_started = datetime.now()
+        self._current_date_str = self._run_started.strftime('%Y-%m-%d')
+        
+        # Cap on concurrent student folder creations (network-bound GitHub calls)
+        self.max_workers = config.get('bulk_processing', {}).get('max_workers', 5)
+        # Cap on concurrent file writes within one student folder
+        self.io_workers = config.get('bulk_processing', {}).get('io_workers', 8)
+        # Every in-flight request keeps its own keep-alive connection
+        self.github.ensure_pool_size(self.max_workers * self.io_workers)
+        
+        # Built on first template render, reused for every file and student
+        self._default_substitutions = None
+        
+        # Blob sha per path in the main repository: seeded from one recursive tree
+        # listing on first use, then kept current from our own writes
+        self._sha_cache: Dict[str, str] = {}
+        self._sha_cache_loaded = False
+        self._sha_cache_lock = threading.Lock()
+        
+        # Students whose folder is already committed, with a fingerprint of the files
+        # that went in, so a re-run after a failure skips them without any API call.
+        # Kept in memory during a run and written out once per batch of folders
+        self._checkpoint_path = config.get('bulk_processing', {}).get(
+            'checkpoint_file', 'data/cache/repo_manager_checkpoint.json'
+        )
+        self._checkpoint_key = f"{self.org}/{self.main_repo_name}"
+        self._checkpoint_lock = threading.Lock()
+        self._done: Dict[str, str] = self._load_checkpoint()
+        self._checkpoint_dirty = False
     
     def create_main_repository(self, project_csv_path: str) -> Dict:
         """Create single main repository with project folders"""
         try:
-            projects = load_project_data(project_csv_path)
+            # Rows are read lazily while earlier folders are already being created,
+            # so fail on a missing file before touching GitHub
+            if not os.path.exists(project_csv_path):
+                raise FileNotFoundError(f"Project data file not found: {project_csv_path}")
+            projects = iter_project_data(project_csv_path)
             
             results = {
                 'main_repo_created': False,
                 'project_folders_created': [],
                 'failed_folders': [],
-                'total_projects': len(projects),
+                'total_projects': 0,
                 'summary': {}
             }
             
-            logger.info(f"Creating main repository '{self.main_repo_name}' for {len(projects)} projects")
+            logger.info(f"Creating main repository '{self.main_repo_name}' for projects in {project_csv_path}")
             
             # Create main repository
             main_repo_success = self.create_single_repository()
@@ -43,14 +144,9 @@ class RepositoryManager:
             
             results['main_repo_created'] = True
             
-            # Create project folders in batches
-            def create_folder(project):
-                return self.create_student_folder(project)
-            
-            batch_results = batch_process(projects, create_folder, batch_size=10, delay=2.0)
-            
-            # Process results
-            for result in batch_results:
+            # Create project folders concurrently, partitioning results as they complete
+            for result in self.iter_student_folders(projects):
+                results['total_projects'] += 1
                 if result.get('status') == 'success':
                     results['project_folders_created'].append(result)
                 else:
@@ -82,7 +178,7 @@ class RepositoryManager:
             if existing_repo:
                 logger.info(f"Repository '{self.main_repo_name}' already exists, using existing repository")
                 # Setup structure in existing repository
-                self.setup_main_repository_structure(project_count)
+                self.setup_main_repository_structure()
                 return True
             else:
                 # Create new repository
@@ -95,7 +191,7 @@ class RepositoryManager:
                 
                 if success:
                     # Setup main repository structure
-                    self.setup_main_repository_structure(project_count)
+                    self.setup_main_repository_structure()
                     logger.info(f"Main repository '{self.main_repo_name}' created successfully")
                     return True
             
@@ -105,34 +201,70 @@ class RepositoryManager:
             logger.error(f"Error creating main repository: {e}")
             return False
 
-    def create_file_in_repo(self, path: str, content: str, message: str) -> bool:
-        """Create file in main repository"""
+    def get_known_sha(self, path: str) -> Optional[str]:
+        """Get blob sha of a path in the main repository, None if it does not exist"""
+        if not self._sha_cache_loaded:
+            with self._sha_cache_lock:
+                if not self._sha_cache_loaded:
+                    tree_shas = self.github.get_tree_shas(self.org, self.main_repo_name) or {}
+                    for file_path, sha in tree_shas.items():
+                        self._sha_cache.setdefault(file_path, sha)
+                    self._sha_cache_loaded = True
+        
+        return self._sha_cache.get(path)
+    
+    def commit_changed_files(self, files: List[tuple], message: str) -> bool:
+        """Commit (path, content) files in one commit, leaving out files that already match"""
+        file_shas = [(file_path, content, git_blob_sha(content.encode('utf-8'))) for file_path, content in files]
+        changed_files = [
+            (file_path, content) for file_path, content, sha in file_shas
+            if self.get_known_sha(file_path) != sha
+        ]
+        
+        if not changed_files:
+            return True
+        
+        success = self.github.commit_files(
+            self.org, self.main_repo_name, changed_files, message, max_workers=self.io_workers
+        )
+        if success:
+            for file_path, _, sha in file_shas:
+                self._sha_cache[file_path] = sha
+        
+        return success
+    
+    def create_file_in_repo(self, path: str, content: str, message: str, log_level: int = logging.DEBUG,
+                            update_message: str = None) -> bool:
+        """Create or update file in main repository, updates use update_message (default "Update {path}")"""
         try:
-            # Check if file already exists
-            existing_file = self.github.get_repository_file(self.org, self.main_repo_name, path)
-            
-            if existing_file:
-                # Update existing file
-                success = self.github.update_repository_file(
-                    org=self.org,
-                    repo=self.main_repo_name,
-                    path=path,
-                    content=content,
-                    message=f"Update {path}",
-                    sha=existing_file['sha']
-                )
-            else:
-                # Create new file
-                success = self.github.create_file(
-                    org=self.org,
-                    repo=self.main_repo_name,
-                    path=path,
-                    message=message,
-                    content=content
+            # Optimistically create (or update with the sha from our own last write);
+            # most paths do not exist on a fresh repository
+            known_sha = self.get_known_sha(path)
+            content_sha = git_blob_sha(content.encode('utf-8'))
+            
+            for attempt in range(3):
+                if known_sha == content_sha:
+                    # Remote file already has exactly this content
+                    self._sha_cache[path] = content_sha
+                    logger.debug(f"Unchanged file: {path}")
+                    return True
+                
+                status_code, new_sha = self.github.put_file(
+                    self.org, self.main_repo_name, path, content,
+                    (update_message or f"Update {path}") if known_sha else message, sha=known_sha
                 )
+                
+                # 422: file exists, 409: stale sha or a concurrent write moved the branch
+                if status_code not in [409, 422]:
+                    break
+                
+                existing_file = self.github.get_repository_file(self.org, self.main_repo_name, path)
+                known_sha = existing_file['sha'] if existing_file else None
             
+            success = status_code in [200, 201]
             if success:
-                logger.debug(f"Created/updated file: {path}")
+                self._sha_cache[path] = new_sha or content_sha
+                logger.log(log_level, f"Created/updated file: {path}")
             
             return success
             
@@ -143,17 +275,19 @@ class RepositoryManager:
     def setup_existing_repository(self, project_csv_path: str) -> Dict:
         """Setup structure in existing repository"""
         try:
-            projects = load_project_data(project_csv_path)
+            if not os.path.exists(project_csv_path):
+                raise FileNotFoundError(f"Project data file not found: {project_csv_path}")
+            projects = iter_project_data(project_csv_path)
             
             results = {
                 'structure_created': False,
                 'student_folders_created': [],
                 'failed_folders': [],
-                'total_students': len(projects),
+                'total_students': 0,
                 'summary': {}
             }
             
-            logger.info(f"Setting up existing repository '{self.main_repo_name}' for {len(projects)} students")
+            logger.info(f"Setting up existing repository '{self.main_repo_name}' for students in {project_csv_path}")
             
             # Check if repository exists
             existing_repo = self.github.get_repository(self.org, self.main_repo_name)
@@ -165,8 +299,8 @@ class RepositoryManager:
             results['structure_created'] = len(structure_result.get('errors', [])) == 0
             
             # Create student folders
-            for student in projects:
-                folder_result = self.create_student_folder(student)
+            for folder_result in self.iter_student_folders(projects):
+                results['total_students'] += 1
                 if folder_result.get('status') == 'success':
                     results['student_folders_created'].append(folder_result)
                 else:
@@ -185,43 +319,67 @@ class RepositoryManager:
             logger.error(f"Failed to setup existing repository: {e}")
             raise
 
+    def iter_student_folders(self, students: Iterable[Dict]) -> Iterator[Dict]:
+        """Create folders for many students concurrently, yielding results in input order"""
+        pending = deque()
+        window = max(1, self.max_workers) * 2
+        
+        # Requests share one session; threads overlap the GitHub round-trips.
+        # Students are pulled from the iterable only as workers free up.
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                for student in students:
+                    pending.append(executor.submit(self.create_student_folder, student))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                
+                while pending:
+                    yield pending.popleft().result()
+        finally:
+            self.save_checkpoint()
+    
     def create_student_folder(self, student: Dict) -> Dict:
         """Create folder structure for individual student"""
         try:
-            folder_name = f"{student['index_number']}-{student['research_area'].replace(' ', '-').replace('/', '-')}"
-            
-            # Create student folder structure
-            folder_structure = [
-                f"projects/{folder_name}/README.md",
-                f"projects/{folder_name}/docs/research_proposal.md",
-                f"projects/{folder_name}/docs/literature_review.md",
-                f"projects/{folder_name}/docs/methodology.md",
-                f"projects/{folder_name}/docs/usage_instructions.md",
-                f"projects/{folder_name}/docs/progress_reports/.gitkeep",
-                f"projects/{folder_name}/src/.gitkeep",
-                f"projects/{folder_name}/data/.gitkeep",
-                f"projects/{folder_name}/experiments/.gitkeep",
-                f"projects/{folder_name}/results/.gitkeep",
-                f"projects/{folder_name}/requirements.txt"
-            ]
-            
-            created_files = []
-            errors = []
+            folder_name = project_folder_name(student)
             
-            for file_path in folder_structure:
-                content = self.get_student_file_content(file_path, student)
-                success = self.create_file_in_repo(file_path, content, f"Initialize {file_path} for {student['index_number']}")
-                
-                if success:
-                    created_files.append(file_path)
-                else:
-                    errors.append(file_path)
+            # Render the whole student folder in one pass
+            files = [
+                (f"projects/{folder_name}/{rel_path}", content)
+                for rel_path, content in self.render_student_files(student).items()
+            ]
+            missing = [file_path for file_path, content in files if content is None]
+            files = [(file_path, content) for file_path, content in files if content is not None]
+            
+            fingerprint = self._folder_fingerprint(files)
+            if not missing and self._done.get(student['index_number']) == fingerprint:
+                logger.debug(f"Folder for {student['index_number']} already committed in an earlier run")
+                return {
+                    'status': 'success',
+                    'student': student,
+                    'folder_name': folder_name,
+                    'created_count': 0,
+                    'error_count': 0,
+                    'errors': [],
+                    'checkpointed': True
+                }
+            
+            # All of the student's files land in a single commit
+            success = self.commit_changed_files(
+                files, f"Initialize project folder for {student['index_number']}"
+            )
+            if success and not missing:
+                self._mark_done(student['index_number'], fingerprint)
+            
+            # Results are kept for the whole run, so record counts rather than path lists
+            errors = missing + ([] if success else [file_path for file_path, _ in files])
             
             return {
                 'status': 'success' if len(errors) == 0 else 'partial',
                 'student': student,
                 'folder_name': folder_name,
-                'created_files': created_files,
+                'created_count': len(files) if success else 0,
+                'error_count': len(errors),
                 'errors': errors
             }
             
@@ -233,24 +391,93 @@ class RepositoryManager:
                 'error': str(e)
             }
 
+    def _folder_fingerprint(self, files: List[tuple]) -> str:
+        """Digest of the (path, content) pairs of one student folder"""
+        digest = hashlib.sha1()
+        for file_path, content in files:
+            digest.update(f"{file_path}\0{git_blob_sha(content.encode('utf-8'))}\n".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _load_checkpoint(self) -> Dict[str, str]:
+        """Load completed student folders for this repository from the checkpoint file"""
+        try:
+            with open(self._checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get(self._checkpoint_key, {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint {self._checkpoint_path}: {e}")
+            return {}
+    
+    def _mark_done(self, index_number: str, fingerprint: str):
+        """Record a committed student folder, written out by the next save_checkpoint"""
+        with self._checkpoint_lock:
+            self._done[index_number] = fingerprint
+            self._checkpoint_dirty = True
+    
+    def save_checkpoint(self):
+        """Persist folders committed since the last save, no-op when nothing changed"""
+        with self._checkpoint_lock:
+            if self._checkpoint_dirty:
+                self._save_checkpoint()
+    
+    def _clear_checkpoint(self):
+        """Forget every completed student folder of this repository"""
+        with self._checkpoint_lock:
+            self._done = {}
+            self._save_checkpoint()
+    
+    def _save_checkpoint(self):
+        """Write this repository's checkpoint entry atomically, caller holds _checkpoint_lock"""
+        try:
+            try:
+                with open(self._checkpoint_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                data = {}
+            if self._done:
+                data[self._checkpoint_key] = self._done
+            else:
+                data.pop(self._checkpoint_key, None)
+            
+            os.makedirs(os.path.dirname(self._checkpoint_path) or '.', exist_ok=True)
+            tmp_path = f"{self._checkpoint_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._checkpoint_path)
+            self._checkpoint_dirty = False
+        except Exception as e:
+            logger.warning(f"Could not save checkpoint {self._checkpoint_path}: {e}")
+    
+    def render_student_files(self, student: Dict) -> Dict[str, Optional[str]]:
+        """Render every file of a student folder, keyed by path relative to the folder"""
+        return {
+            rel_path: self._render_student_file(rel_path.rsplit('/', 1)[-1], method_name, student)
+            for rel_path, method_name in self._STUDENT_LAYOUT
+        }
+    
     def get_student_file_content(self, file_path: str, student: Dict) -> str:
         """Get appropriate content for student files"""
-        if file_path.endswith('README.md') and 'projects/' in file_path:
-            return self.generate_project_readme(student)
-        elif file_path.endswith('research_proposal.md'):
-            return self.generate_proposal_template(student)
-        elif file_path.endswith('literature_review.md'):
-            return self.generate_literature_review_template(student)
-        elif file_path.endswith('methodology.md'):
-            return self.generate_methodology_template(student)
-        elif file_path.endswith('requirements.txt'):
+        file_name = file_path.rsplit('/', 1)[-1]
+        if file_name not in self._STUDENT_FILE_HANDLERS:
+            return "# Placeholder file\n"
+        return self._render_student_file(file_name, self._STUDENT_FILE_HANDLERS[file_name], student)
+    
+    def _render_student_file(self, file_name: str, method_name: Optional[str], student: Dict) -> str:
+        """Render one student file with its generator, or its static content"""
+        if method_name:
+            return getattr(self, method_name)(student)
+        return self._static_for(file_name)
+    
+    def _static_for(self, file_name: str) -> str:
+        """Get student file content that is the same for every student"""
+        if file_name == 'requirements.txt':
             return self.load_template('project/requirements.txt') or self.generate_requirements_template()
-        elif file_path.endswith('.gitkeep'):
-            return "# This file keeps the directory in git\n# You can delete this file once you add other files to this directory\n"
-        elif file_path.endswith('usage_instructions.md'):
+        elif file_name == 'usage_instructions.md':
             return self.load_template('project/usage_instructions.md') or "# Student Usage Instructions\n\n[Instructions will be loaded from template]"
-        else:
-            return "# Placeholder file\n"
+        return self._STATIC_CONTENT[file_name]
 
     def setup_main_repository_structure(self) -> Dict:
         """Setup main repository structure and files"""
@@ -275,13 +502,12 @@ class RepositoryManager:
                 ('.github/ISSUE_TEMPLATE/milestone_submission.md', self.load_template('issues/milestone_submission.md'))
             ]
             
-            for file_path, content in main_files:
-                if content:
-                    success = self.create_file_in_repo(file_path, content, f"Initialize {file_path}")
-                    if success:
-                        setup_results['files_created'].append(file_path)
-                    else:
-                        setup_results['errors'].append(f"Failed to create {file_path}")
+            # Whole scaffold goes in as a single commit
+            main_files = [(file_path, content) for file_path, content in main_files if content]
+            if self.commit_changed_files(main_files, "Initialize repository scaffold"):
+                setup_results['files_created'].extend(file_path for file_path, _ in main_files)
+            else:
+                setup_results['errors'].extend(f"Failed to create {file_path}" for file_path, _ in main_files)
             
             # Create project milestones
             milestones_result = self.create_project_milestones()
@@ -299,14 +525,17 @@ class RepositoryManager:
         
         try:
             milestones_config = self.config.get('milestones', {})
+            if not milestones_config:
+                return created_milestones
             
-            for milestone_key, milestone_data in milestones_config.items():
+            def create_milestone(item):
+                milestone_key, milestone_data = item
                 title = milestone_data.get('title', milestone_key.replace('_', ' ').title())
                 description = milestone_data.get('description', f'{title} milestone for all projects')
                 
                 # Calculate due date based on week
                 if 'week' in milestone_data:
-                    due_date = (datetime.now() + timedelta(weeks=milestone_data['week'])).isoformat()
+                    due_date = (self._run_started + timedelta(weeks=milestone_data['week'])).isoformat()
                 else:
                     due_date = None
                 
@@ -317,7 +546,13 @@ class RepositoryManager:
                     description=description,
                     due_date=due_date
                 )
-                
+                return milestone_key, milestone_data, title, milestone_id
+            
+            # Milestones are independent; the shared client keeps rate limiting coordinated
+            with ThreadPoolExecutor(max_workers=max(1, min(self.io_workers, len(milestones_config)))) as executor:
+                outcomes = list(executor.map(create_milestone, milestones_config.items()))
+            
+            for milestone_key, milestone_data, title, milestone_id in outcomes:
                 if milestone_id:
                     created_milestones.append({
                         'id': milestone_id,
@@ -335,13 +570,10 @@ class RepositoryManager:
     def load_template(self, template_path: str) -> Optional[str]:
         """Load template content from file"""
         try:
-            full_path = os.path.join(self.templates_dir, template_path)
-            if os.path.exists(full_path):
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            else:
-                logger.warning(f"Template not found: {full_path}")
-                return None
+            content = self._templates.get(template_path)
+            if content is None:
+                logger.warning(f"Template not found: {os.path.join(self.templates_dir, template_path)}")
+            return content
                 
         except Exception as e:
             logger.error(f"Error loading template {template_path}: {e}")
@@ -354,32 +586,40 @@ class RepositoryManager:
             if not template_content:
                 return None
             
-            # Default substitutions from config
-            default_substitutions = {
-                'MAIN_REPO_NAME': self.main_repo_name,
-                'COURSE_NAME': self.config.get('project', {}).get('course_name', 'Advanced Machine Learning'),
-                'COURSE_CODE': self.config.get('project', {}).get('course_code', 'CS4681'),
-                'ACADEMIC_YEAR': self.config.get('project', {}).get('academic_year', '2024/2025'),
-                'SEMESTER': self.config.get('project', {}).get('semester', '7'),
-                'ORGANIZATION': self.org,
-                'CURRENT_DATE': datetime.now().strftime('%Y-%m-%d'),
-                'SUPERVISOR_USERNAME': self.config.get('supervisors', [{}])[0].get('github_username', 'supervisor')
-            }
-            
-            # Merge with provided substitutions
+            # Default substitutions from config, merged with provided substitutions
+            default_substitutions = dict(self.get_default_substitutions())
             if substitutions:
                 default_substitutions.update(substitutions)
             
-            # Perform substitutions
-            for key, value in default_substitutions.items():
-                template_content = template_content.replace(f'{{{key}}}', str(value))
-            
-            return template_content
+            # Fill the pre-split placeholder slots, leaving unknown placeholders as-is
+            rendered = list(_template_parts(template_content))
+            for i in range(1, len(rendered), 2):
+                name = rendered[i]
+                rendered[i] = str(default_substitutions[name]) if name in default_substitutions else f"{{{name}}}"
+            return ''.join(rendered)
             
         except Exception as e:
             logger.error(f"Error loading template with substitution {template_path}: {e}")
             return None
     
+    def get_default_substitutions(self) -> Dict:
+        """Get config-derived template substitutions (computed once per instance)"""
+        if self._default_substitutions is None:
+            project_config = self.config.get('project', {})
+            supervisors = self.config.get('supervisors', {}).get('supervisors', [])
+            self._default_substitutions = {
+                'MAIN_REPO_NAME': self.main_repo_name,
+                'COURSE_NAME': project_config.get('course_name', 'Advanced Machine Learning'),
+                'COURSE_CODE': project_config.get('course_code', 'CS4681'),
+                'ACADEMIC_YEAR': project_config.get('academic_year', '2024/2025'),
+                'SEMESTER': project_config.get('semester', '7'),
+                'ORGANIZATION': self.org,
+                'CURRENT_DATE': self._current_date_str,
+                'SUPERVISOR_USERNAME': (supervisors[0] if supervisors else {}).get('github_username', 'supervisor')
+            }
+        
+        return self._default_substitutions
+    
     def generate_project_readme(self, student: Dict) -> str:
         """Generate personalized README for student folder"""
         substitutions = {
@@ -387,7 +627,7 @@ class RepositoryManager:
             'RESEARCH_AREA': student['research_area'],
             'GITHUB_USERNAME': student.get('github_username', 'Not provided'),
             'STUDENT_EMAIL': student.get('email', 'Not provided'),
-            'FOLDER_NAME': student['research_area'].replace(' ', '-')
+            'FOLDER_NAME': folder_slug(student['research_area'])
         }
         
         return self.load_template_with_substitution('project/project_readme.md', substitutions)
@@ -451,41 +691,6 @@ python-dotenv>=0.19.0
 # Add your specific requirements below
 """
         
-    def create_or_update_file(self, file_path: str, content: str, commit_message: str) -> bool:
-        """Create or update a file in the repository"""
-        try:
-            # Check if file already exists
-            existing_file = self.github.get_repository_file(self.org, self.main_repo_name, file_path)
-            
-            if existing_file:
-                # Update existing file
-                success = self.github.update_repository_file(
-                    org=self.org,
-                    repo=self.main_repo_name,
-                    path=file_path,
-                    content=content,
-                    message=commit_message,
-                    sha=existing_file['sha']
-                )
-            else:
-                # Create new file
-                success = self.github.create_file(
-                    org=self.org,
-                    repo=self.main_repo_name,
-                    path=file_path,
-                    message=commit_message,
-                    content=content
-                )
-            
-            if success:
-                self.logger.info(f"Created/updated file: {file_path}")
-            
-            return success
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create/update file {file_path}: {e}")
-            return False
-            
     def update_repository_settings(self) -> bool:
         """Update main repository settings"""
         try:
@@ -513,6 +718,12 @@ python-dotenv>=0.19.0
             
             if response.status_code == 204:
                 logger.warning(f"Deleted repository: {self.main_repo_name}")
+                # Nothing committed to the old repository carries over to a recreated one
+                self._clear_checkpoint()
+                self.github.forget_repository(self.org, self.main_repo_name)
+                with self._sha_cache_lock:
+                    self._sha_cache.clear()
+                    self._sha_cache_loaded = False
                 return True
             else:
                 logger.error(f"Failed to delete repository: {response.status_code}")
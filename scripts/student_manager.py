@@ -1,70 +1,24 @@
+import copy
 import logging
+import time
+import threading
 from typing import Dict, List, Optional
-from .github_client import GitHubClient
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from .github_client import GitHubClient, get_github_client
+from .utils import project_folder_name
 
 logger = logging.getLogger(__name__)
 
-class StudentManager:
-    def __init__(self, config: Dict):
-        self.config = config
-        self.github = GitHubClient(config['github']['token'])
-        self.org = config['github']['organization']
-        self.repo_name = config['repository']['name']
-        
-    def create_student_issues(self, project_data: Dict) -> Dict:
-        """Create milestone tracking issues for individual student"""
-        try:
-            project_folder = f"projects/{project_data['index_number']}-{project_data['research_area'].replace(' ', '-')}"
-            project_label = f"student-{project_data['index_number']}"
-            
-            # Create milestone issues
-            milestones = self._get_milestone_templates(project_data, project_folder, project_label)
-            
-            created_issues = []
-            for milestone in milestones:
-                try:
-                    issue_number = self.github.create_issue(
-                        org=self.org,
-                        repo=self.repo_name,
-                        title=milestone['title'],
-                        body=milestone['body'],
-                        labels=milestone['labels']
-                    )
-                    
-                    if issue_number:
-                        created_issues.append({
-                            'number': issue_number,
-                            'title': milestone['title'],
-                            'type': milestone['type']
-                        })
-                        logger.debug(f"Created issue: {milestone['title']}")
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to create issue {milestone['title']}: {e}")
-            
-            return {
-                'status': 'success',
-                'student': project_data,
-                'issues_created': created_issues,
-                'project_label': project_label
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to create issues for {project_data['index_number']}: {e}")
-            return {
-                'status': 'error',
-                'error': str(e),
-                'student': project_data
-            }
-
-    def _get_milestone_templates(self, project_data: Dict, project_folder: str, project_label: str) -> List[Dict]:
-        """Get milestone issue templates"""
-        return [
-            {
-                'title': f"📋 Research Proposal - {project_data['index_number']}",
-                'type': 'research_proposal',
-                'body': f"""**Student:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
+# Milestone issues opened for every student: (type, title, body, static labels)
+# Placeholders: index_number, research_area, project_folder, supervisor_tags; the
+# student's project label is added in front of the static labels
+_MILESTONE_TEMPLATES = (
+    (
+        'research_proposal',
+        "📋 Research Proposal - {index_number}",
+        """**Student:** {index_number}
+**Research Area:** {research_area}
 **Folder:** `{project_folder}/`
 
 ### Research Proposal Requirements:
@@ -82,15 +36,15 @@ class StudentManager:
 1. Complete the research proposal document
 2. Commit changes to your folder
 3. Comment on this issue with "Ready for Review"
-4. Tag supervisors: {self._get_supervisor_tags()}
+4. Tag supervisors: {supervisor_tags}
 """,
-                'labels': ['research-proposal', project_label, 'milestone', 'week-4']
-            },
-            {
-                'title': f"📚 Literature Review - {project_data['index_number']}",
-                'type': 'literature_review',
-                'body': f"""**Student:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
+        ('research-proposal', 'milestone', 'week-4')
+    ),
+    (
+        'literature_review',
+        "📚 Literature Review - {index_number}",
+        """**Student:** {index_number}
+**Research Area:** {research_area}
 **Folder:** `{project_folder}/`
 
 ### Literature Review Requirements:
@@ -110,13 +64,13 @@ class StudentManager:
 - Clear categorization of related work
 - Gap analysis leading to your research question
 """,
-                'labels': ['literature-review', project_label, 'milestone', 'week-5']
-            },
-            {
-                'title': f"🔧 Methodology & Implementation - {project_data['index_number']}",
-                'type': 'implementation',
-                'body': f"""**Student:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
+        ('literature-review', 'milestone', 'week-5')
+    ),
+    (
+        'implementation',
+        "🔧 Methodology & Implementation - {index_number}",
+        """**Student:** {index_number}
+**Research Area:** {research_area}
 **Folder:** `{project_folder}/`
 
 ### Implementation Requirements:
@@ -141,13 +95,13 @@ class StudentManager:
 - Version control best practices
 - README with setup instructions
 """,
-                'labels': ['implementation', project_label, 'milestone', 'week-8']
-            },
-            {
-                'title': f"📊 Final Evaluation - {project_data['index_number']}",
-                'type': 'final_evaluation',
-                'body': f"""**Student:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
+        ('implementation', 'milestone', 'week-8')
+    ),
+    (
+        'final_evaluation',
+        "📊 Final Evaluation - {index_number}",
+        """**Student:** {index_number}
+**Research Area:** {research_area}
 **Folder:** `{project_folder}/`
 
 ### Final Evaluation Requirements:
@@ -174,25 +128,144 @@ class StudentManager:
 - Clear communication and presentation
 - Code quality and reproducibility
 """,
-                'labels': ['final-evaluation', project_label, 'milestone', 'week-12']
+        ('final-evaluation', 'milestone', 'week-12')
+    ),
+)
+
+# Milestone label -> phase name, in the order students work through them
+_MILESTONE_PHASES = (
+    ('research-proposal', 'Research Proposal'),
+    ('literature-review', 'Literature Review'),
+    ('implementation', 'Implementation'),
+    ('final-evaluation', 'Final Evaluation')
+)
+_PHASE_LABELS = frozenset(label for label, _ in _MILESTONE_PHASES)
+
+class StudentManager:
+    def __init__(self, config: Dict):
+        self.config = config
+        self.org = config['github']['organization']
+        self.repo_name = config['repository']['name']
+        
+        # Same mentions go into every milestone issue of every student
+        supervisors = config.get('supervisors', {}).get('supervisors', [])
+        self._supervisor_tags = " ".join(
+            f"@{supervisor['github_username']}" for supervisor in supervisors if supervisor.get('github_username')
+        ) or "@supervisor"
+        
+        # Recently computed progress per student: index_number -> (monotonic time, result)
+        self.progress_ttl = 60
+        self._progress_cache: Dict[str, tuple] = {}
+        self._progress_lock = threading.Lock()
+        
+    @cached_property
+    def github(self) -> GitHubClient:
+        """Shared GitHub client, set up on first use rather than at construction"""
+        return get_github_client(self.config['github']['token'])
+    
+    def create_student_issues(self, project_data: Dict) -> Dict:
+        """Create milestone tracking issues for individual student"""
+        try:
+            project_folder = f"projects/{project_folder_name(project_data)}"
+            project_label = f"student-{project_data['index_number']}"
+            
+            # Create milestone issues
+            milestones = self._get_milestone_templates(project_data, project_folder, project_label)
+            
+            # One aliased GraphQL mutation for all milestones, REST one issue at a time if that fails;
+            # concurrent content-creating POSTs trip GitHub's secondary rate limit
+            batch = self.github.create_issues_graphql(self.org, self.repo_name, milestones)
+            if batch is not None:
+                issue_numbers = []
+                for milestone, issue in zip(milestones, batch):
+                    if issue:
+                        logger.debug(f"Created issue: {milestone['title']}")
+                    else:
+                        logger.warning(f"Failed to create issue {milestone['title']}")
+                    issue_numbers.append(issue['number'] if issue else None)
+            else:
+                issue_numbers = [self._create_milestone_issue(milestone) for milestone in milestones]
+            
+            created_issues = [
+                {
+                    'number': issue_number,
+                    'title': milestone['title'],
+                    'type': milestone['type']
+                }
+                for milestone, issue_number in zip(milestones, issue_numbers) if issue_number
+            ]
+            
+            # New issues change this student's progress
+            with self._progress_lock:
+                self._progress_cache.pop(project_data['index_number'], None)
+            
+            return {
+                'status': 'success',
+                'student': project_data,
+                'issues_created': created_issues,
+                'project_label': project_label
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to create issues for {project_data['index_number']}: {e}")
+            return {
+                'status': 'error',
+                'error': str(e),
+                'student': project_data
+            }
+
+    def _create_milestone_issue(self, milestone: Dict) -> Optional[int]:
+        """Open one milestone issue, returning its number"""
+        try:
+            issue_number = self.github.create_issue(
+                org=self.org,
+                repo=self.repo_name,
+                title=milestone['title'],
+                body=milestone['body'],
+                labels=milestone['labels']
+            )
+            
+            if issue_number:
+                logger.debug(f"Created issue: {milestone['title']}")
+            return issue_number
+            
+        except Exception as e:
+            logger.warning(f"Failed to create issue {milestone['title']}: {e}")
+            return None
+    
+    def _get_milestone_templates(self, project_data: Dict, project_folder: str, project_label: str) -> List[Dict]:
+        """Get milestone issue templates"""
+        context = {
+            'index_number': project_data['index_number'],
+            'research_area': project_data['research_area'],
+            'project_folder': project_folder,
+            'supervisor_tags': self._supervisor_tags
+        }
+        
+        return [
+            {
+                'title': title.format_map(context),
+                'type': milestone_type,
+                'body': body.format_map(context),
+                'labels': [project_label, *labels]
             }
+            for milestone_type, title, body, labels in _MILESTONE_TEMPLATES
         ]
 
     def _get_supervisor_tags(self) -> str:
         """Get supervisor GitHub mentions"""
-        supervisors_data = self.config.get('supervisors', {}).get('supervisors', [])
-        supervisor_tags = []
-        
-        for supervisor in supervisors_data:
-            username = supervisor.get('github_username')
-            if username:
-                supervisor_tags.append(f"@{username}")
-        
-        return " ".join(supervisor_tags) if supervisor_tags else "@supervisor"
+        return self._supervisor_tags
 
     def track_project_progress(self, project_data: Dict) -> Dict:
         """Track individual student progress"""
         try:
+            now = time.monotonic()
+            with self._progress_lock:
+                cached = self._progress_cache.get(project_data['index_number'])
+            # Callers get their own copy, the cached result (nested summary included) stays untouched
+            if cached and now - cached[0] < self.progress_ttl:
+                return copy.deepcopy(cached[1])
+            
             project_label = f"student-{project_data['index_number']}"
             
             # Get all issues for this student
@@ -203,27 +276,98 @@ class StudentManager:
                 state='all'
             )
             
-            # Calculate progress metrics
-            total_milestones = len([i for i in all_issues if 'milestone' in [l['name'] for l in i.get('labels', [])]])
-            completed_milestones = len([i for i in all_issues if i['state'] == 'closed' and 'milestone' in [l['name'] for l in i.get('labels', [])]])
+            # One pass over the issues, the helpers below only read the aggregate
+            aggregate = self._aggregate_issues(all_issues)
+            total_milestones = aggregate['total_milestones']
+            completed_milestones = aggregate['completed_milestones']
             
             progress_percentage = (completed_milestones / max(total_milestones, 1)) * 100
-            current_phase = self._determine_current_phase(all_issues)
+            current_phase = self._determine_current_phase(aggregate)
             
-            return {
+            result = {
                 'student_id': project_data['index_number'],
-                'project_folder': f"projects/{project_data['index_number']}-{project_data['research_area'].replace(' ', '-')}",
+                'project_folder': f"projects/{project_folder_name(project_data)}",
                 'total_milestones': total_milestones,
                 'completed_milestones': completed_milestones,
                 'progress_percentage': progress_percentage,
                 'current_phase': current_phase,
-                'recent_activity': self._check_recent_activity(all_issues),
-                'issues_summary': self._summarize_issues(all_issues)
+                'recent_activity': self._check_recent_activity(aggregate),
+                'issues_summary': self._summarize_issues(aggregate)
             }
             
+            with self._progress_lock:
+                self._progress_cache[project_data['index_number']] = (now, result)
+            return copy.deepcopy(result)
+            
         except Exception as e:
             logger.error(f"Failed to track progress for {project_data['index_number']}: {e}")
             return {
                 'student_id': project_data['index_number'],
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+
+    def _aggregate_issues(self, issues: List[Dict]) -> Dict:
+        """Collect every metric track_project_progress needs in a single pass"""
+        aggregate = {
+            'total_milestones': 0,
+            'completed_milestones': 0,
+            'open_phases': set(),
+            'closed_phases': set(),
+            'open': 0,
+            'closed': 0,
+            'latest_update': None
+        }
+        
+        for issue in issues:
+            labels = frozenset(label['name'] for label in issue.get('labels', ()))
+            is_open = issue['state'] != 'closed'
+            aggregate['open' if is_open else 'closed'] += 1
+            
+            if 'milestone' in labels:
+                aggregate['total_milestones'] += 1
+                aggregate['open_phases' if is_open else 'closed_phases'].update(labels & _PHASE_LABELS)
+                if not is_open:
+                    aggregate['completed_milestones'] += 1
+            
+            # ISO 8601 timestamps in UTC compare correctly as strings
+            updated_at = issue.get('updated_at')
+            if updated_at and (aggregate['latest_update'] is None or updated_at > aggregate['latest_update']):
+                aggregate['latest_update'] = updated_at
+        
+        return aggregate
+
+    def _determine_current_phase(self, aggregate: Dict) -> str:
+        """Current phase is the earliest milestone still open"""
+        if aggregate['total_milestones'] == 0:
+            return "Not Started"
+        
+        for label, phase in _MILESTONE_PHASES:
+            if label in aggregate['open_phases']:
+                return phase
+        
+        return "Completed" if aggregate['completed_milestones'] == aggregate['total_milestones'] else "In Progress"
+
+    def _check_recent_activity(self, aggregate: Dict, days: int = 7) -> bool:
+        """Check if any issue was updated within the last days"""
+        if not aggregate['latest_update']:
+            return False
+        
+        try:
+            latest_update = datetime.strptime(aggregate['latest_update'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+            return latest_update > datetime.now(timezone.utc) - timedelta(days=days)
+        except ValueError:
+            return False
+
+    def _summarize_issues(self, aggregate: Dict) -> Dict:
+        """Summarize issue counts"""
+        return {
+            'total': aggregate['open'] + aggregate['closed'],
+            'open': aggregate['open'],
+            'closed': aggregate['closed'],
+            'last_updated': aggregate['latest_update'],
+            'milestones': {
+                phase: 'open' if label in aggregate['open_phases'] else 'closed'
+                for label, phase in _MILESTONE_PHASES
+                if label in aggregate['open_phases'] or label in aggregate['closed_phases']
+            }
+        }
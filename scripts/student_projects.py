@@ -2,19 +2,194 @@
 Individual project project management for single repository with folders
 """
 
+import heapq
 import logging
+import time
+import threading
 from typing import Dict, List, Optional
-from .github_client import GitHubClient
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from .github_client import get_github_client
 
 logger = logging.getLogger(__name__)
 
+# Static bodies are built once at import; only the {fields} vary per project
+_PROJECT_README_TEMPLATE = """# Research Project - {index_number}
+
+**project:** {index_number}  
+**Research Area:** {research_area}  
+**Email:** {email}  
+**GitHub:** @{github_username}
+
+## Project Structure
+
+```
+{index_number}/
+├── README.md              # This file
+├── docs/                  # Documentation and reports
+│   ├── literature_review.md
+│   ├── methodology.md
+│   ├── mid_report.md
+│   └── final_paper.md
+├── src/                   # Source code
+├── data/                  # Datasets
+├── results/               # Experimental results
+└── requirements.txt       # Dependencies
+```
+
+## Milestones
+
+- [ ] **Week 4:** Literature Review
+- [ ] **Week 8:** Methodology & Implementation
+- [ ] **Week 10:** Mid Evaluation
+- [ ] **Week 16:** Final Evaluation
+
+## Progress Tracking
+
+Track your progress using GitHub Issues with label `project-{index_number}`.
+
+## Getting Started
+
+1. Update this README with your specific project details
+2. Complete the literature review in `docs/literature_review.md`
+3. Add your code to `src/` folder
+4. Update progress through GitHub Issues
+
+---
+*Generated automatically by GitHub Research Project Manager*
+"""
+
+_LITERATURE_TEMPLATE = """# Literature Review
+
+## Abstract
+
+Brief summary of your literature review findings.
+
+## Introduction
+
+Background and context of your research area.
+
+## Related Work
+
+### Category 1: [Topic Area]
+
+- **Paper 1:** Author et al. (Year). Title. Venue. 
+  - Key findings:
+  - Limitations:
+  
+- **Paper 2:** Author et al. (Year). Title. Venue.
+  - Key findings:
+  - Limitations:
+
+### Category 2: [Topic Area]
+
+[Continue with more papers...]
+
+## Research Gaps
+
+Identify gaps in current research that your project will address.
+
+## Methodology
+
+Proposed approach based on literature analysis.
+
+## References
+
+[Add your references here in standard format]
+
+---
+*Update this document as you progress through your literature review*
+"""
+
+# Milestone issues opened for every project: (title, body, stage label)
+_PROJECT_MILESTONES = (
+    (
+        "📚 Literature Review - {index_number}",
+        """**project:** {index_number}
+**Research Area:** {research_area}
+**Folder:** `{project_folder}/`
+
+### Tasks:
+- [ ] Research relevant papers in {research_area}
+- [ ] Create comprehensive literature review
+- [ ] Identify research gaps
+- [ ] Submit literature review document
+
+**Deliverable:** `{project_folder}/docs/literature_review.md`
+**Deadline:** Week 4""",
+        'literature-review'
+    ),
+    (
+        "🔬 Methodology & Implementation - {index_number}",
+        """**project:** {index_number}
+**Research Area:** {research_area}
+**Folder:** `{project_folder}/`
+
+### Tasks:
+- [ ] Define research methodology
+- [ ] Implement baseline models
+- [ ] Setup experimental framework
+- [ ] Data preprocessing pipeline
+
+**Deliverable:** Working code in `{project_folder}/src/` folder
+**Deadline:** Week 8""",
+        'implementation'
+    ),
+    (
+        "📊 Mid Evaluation - {index_number}",
+        """**project:** {index_number}
+**Research Area:** {research_area}
+**Folder:** `{project_folder}/`
+
+### Tasks:
+- [ ] Submit mid-term progress report
+- [ ] Present preliminary results
+- [ ] Address supervisor feedback
+- [ ] Update project timeline
+
+**Deliverable:** Mid-term report + presentation in `{project_folder}/docs/`
+**Deadline:** Week 10""",
+        'mid-evaluation'
+    ),
+    (
+        "📝 Final Evaluation - {index_number}",
+        """**project:** {index_number}
+**Research Area:** {research_area}
+**Folder:** `{project_folder}/`
+
+### Tasks:
+- [ ] Complete experimental evaluation
+- [ ] Write research paper
+- [ ] Prepare final presentation
+- [ ] Submit all deliverables
+
+**Deliverable:** Complete research paper + code in `{project_folder}/`
+**Deadline:** Week 16""",
+        'final-evaluation'
+    ),
+)
+
+# Milestone classification in priority order: (milestone, label, title keywords)
+_MILESTONE_RULES = (
+    ('Literature Review', 'literature-review', ('literature',)),
+    ('Implementation', 'implementation', ('implementation', 'methodology')),
+    ('Mid Evaluation', 'mid-evaluation', ('mid',)),
+    ('Final Evaluation', 'final-evaluation', ('final',))
+)
+
 class StudentProjectManager:
     def __init__(self, config: Dict):
         self.config = config
-        self.github = GitHubClient(config['github']['token'])
+        self.github = get_github_client(config['github']['token'])
         self.org = config['github']['organization']
         self.repo_name = config['repository']['name']  # Single repo: In21-S7-CS4681-AML-Research-Projects
         
+        # Recently fetched issues per project label: label -> (monotonic time, issues)
+        self.issues_ttl = 60
+        self._issues_cache: Dict[str, tuple] = {}
+        self._issues_lock = threading.Lock()
+        self.max_workers = config.get('bulk_processing', {}).get('max_workers', 5)
+        
     def create_project_folder_structure(self, project_data: Dict) -> Dict:
         """Create folder structure for project in the main repository"""
         try:
@@ -32,24 +207,21 @@ class StudentProjectManager:
                 f"{project_folder}/requirements.txt": "# Add your Python dependencies here"
             }
             
-            # Create files via GitHub API
-            for file_path, content in files_to_create.items():
-                try:
-                    self.github.create_file(
-                        org=self.org,
-                        repo=self.repo_name,
-                        path=file_path,
-                        message=f"Initialize folder structure for {project_data['index_number']}",
-                        content=content
-                    )
-                except Exception as e:
-                    logger.warning(f"Could not create {file_path}: {e}")
+            # All files land in one commit (blobs, tree, commit, ref update) instead of one commit per file
+            success = self.github.commit_files(
+                self.org,
+                self.repo_name,
+                list(files_to_create.items()),
+                f"Initialize folder structure for {project_data['index_number']}"
+            )
+            if not success:
+                logger.warning(f"Could not create folder structure for {project_data['index_number']}")
             
             return {
-                'status': 'success',
+                'status': 'success' if success else 'error',
                 'project_folder': project_folder,
                 'project': project_data,
-                'files_created': list(files_to_create.keys())
+                'files_created': list(files_to_create.keys()) if success else []
             }
             
         except Exception as e:
@@ -66,91 +238,55 @@ class StudentProjectManager:
             project_folder = f"projects/{project_data['index_number']}"
             
             # Create milestone issues
+            context = {
+                'index_number': project_data['index_number'],
+                'research_area': project_data['research_area'],
+                'project_folder': project_folder
+            }
+            project_label = f"project-{project_data['index_number']}"
             milestones = [
                 {
-                    'title': f"📚 Literature Review - {project_data['index_number']}",
-                    'body': f"""**project:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
-**Folder:** `{project_folder}/`
-
-### Tasks:
-- [ ] Research relevant papers in {project_data['research_area']}
-- [ ] Create comprehensive literature review
-- [ ] Identify research gaps
-- [ ] Submit literature review document
-
-**Deliverable:** `{project_folder}/docs/literature_review.md`
-**Deadline:** Week 4""",
-                    'labels': ['literature-review', f'project-{project_data["index_number"]}', 'milestone']
-                },
-                {
-                    'title': f"🔬 Methodology & Implementation - {project_data['index_number']}",
-                    'body': f"""**project:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
-**Folder:** `{project_folder}/`
-
-### Tasks:
-- [ ] Define research methodology
-- [ ] Implement baseline models
-- [ ] Setup experimental framework
-- [ ] Data preprocessing pipeline
-
-**Deliverable:** Working code in `{project_folder}/src/` folder
-**Deadline:** Week 8""",
-                    'labels': ['implementation', f'project-{project_data["index_number"]}', 'milestone']
-                },
-                {
-                    'title': f"📊 Mid Evaluation - {project_data['index_number']}",
-                    'body': f"""**project:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
-**Folder:** `{project_folder}/`
-
-### Tasks:
-- [ ] Submit mid-term progress report
-- [ ] Present preliminary results
-- [ ] Address supervisor feedback
-- [ ] Update project timeline
-
-**Deliverable:** Mid-term report + presentation in `{project_folder}/docs/`
-**Deadline:** Week 10""",
-                    'labels': ['mid-evaluation', f'project-{project_data["index_number"]}', 'milestone']
-                },
-                {
-                    'title': f"📝 Final Evaluation - {project_data['index_number']}",
-                    'body': f"""**project:** {project_data['index_number']}
-**Research Area:** {project_data['research_area']}
-**Folder:** `{project_folder}/`
-
-### Tasks:
-- [ ] Complete experimental evaluation
-- [ ] Write research paper
-- [ ] Prepare final presentation
-- [ ] Submit all deliverables
-
-**Deliverable:** Complete research paper + code in `{project_folder}/`
-**Deadline:** Week 16""",
-                    'labels': ['final-evaluation', f'project-{project_data["index_number"]}', 'milestone']
+                    'title': title.format_map(context),
+                    'body': body.format_map(context),
+                    'labels': [stage_label, project_label, 'milestone']
                 }
+                for title, body, stage_label in _PROJECT_MILESTONES
             ]
             
+            # One aliased GraphQL mutation for all milestones, REST per issue if that fails
             created_issues = []
-            for milestone in milestones:
-                try:
-                    issue = self.github.create_issue(
-                        org=self.org,
-                        repo=self.repo_name,
-                        title=milestone['title'],
-                        body=milestone['body'],
-                        labels=milestone['labels']
-                    )
-                    created_issues.append({
-                        'number': issue['number'],
-                        'title': issue['title'],
-                        'url': issue['html_url']
-                    })
-                    logger.debug(f"Created issue: {milestone['title']}")
-                except Exception as e:
-                    logger.warning(f"Failed to create issue {milestone['title']}: {e}")
+            batch = self.github.create_issues_graphql(self.org, self.repo_name, milestones)
+            if batch is not None:
+                for milestone, issue in zip(milestones, batch):
+                    if issue:
+                        created_issues.append(issue)
+                        logger.debug(f"Created issue: {milestone['title']}")
+                    else:
+                        logger.warning(f"Failed to create issue {milestone['title']}")
+            else:
+                for milestone in milestones:
+                    try:
+                        number = self.github.create_issue(
+                            org=self.org,
+                            repo=self.repo_name,
+                            title=milestone['title'],
+                            body=milestone['body'],
+                            labels=milestone['labels']
+                        )
+                        if number is None:
+                            raise RuntimeError("GitHub API request failed")
+                        created_issues.append({
+                            'number': number,
+                            'title': milestone['title'],
+                            'url': f"https://github.com/{self.org}/{self.repo_name}/issues/{number}"
+                        })
+                        logger.debug(f"Created issue: {milestone['title']}")
+                    except Exception as e:
+                        logger.warning(f"Failed to create issue {milestone['title']}: {e}")
+            
+            # New issues change this project's listing
+            with self._issues_lock:
+                self._issues_cache.pop(f"project-{project_data['index_number']}", None)
             
             return {
                 'status': 'success',
@@ -170,31 +306,8 @@ class StudentProjectManager:
         """Update project progress based on their issues"""
         try:
             # Get project-specific issues
-            all_issues = self.github.list_issues(self.org, self.repo_name)
-            project_label = f"project-{project_data['index_number']}"
-            project_issues = [issue for issue in all_issues 
-                            if any(label['name'] == project_label for label in issue.get('labels', []))]
-            
-            # Calculate progress metrics
-            total_issues = len(project_issues)
-            closed_issues = len([i for i in project_issues if i['state'] == 'closed'])
-            open_issues = total_issues - closed_issues
-            
-            progress_percentage = (closed_issues / max(total_issues, 1)) * 100
-            
-            # Determine current phase
-            current_phase = self._determine_current_phase(progress_percentage, project_issues)
-            
-            return {
-                'project_id': project_data['index_number'],
-                'project_folder': f"projects/{project_data['index_number']}",
-                'total_issues': total_issues,
-                'closed_issues': closed_issues,
-                'open_issues': open_issues,
-                'progress_percentage': progress_percentage,
-                'current_phase': current_phase,
-                'last_updated': project_issues[0]['updated_at'] if project_issues else None
-            }
+            project_issues = self._get_project_issues(project_data)
+            return self._progress_view(project_data, project_issues, self._aggregate_issues(project_issues))
             
         except Exception as e:
             logger.error(f"Failed to update progress for {project_data['index_number']}: {e}")
@@ -203,6 +316,47 @@ class StudentProjectManager:
                 'error': str(e)
             }
     
+    def _progress_view(self, project_data: Dict, project_issues: List[Dict], aggregate: Dict) -> Dict:
+        """Progress summary from an aggregated issue list"""
+        total_issues = aggregate['total']
+        closed_issues = aggregate['closed']
+        
+        progress_percentage = (closed_issues / max(total_issues, 1)) * 100
+        
+        # Determine current phase
+        current_phase = self._determine_current_phase(progress_percentage, project_issues)
+        
+        return {
+            'project_id': project_data['index_number'],
+            'project_folder': f"projects/{project_data['index_number']}",
+            'total_issues': total_issues,
+            'closed_issues': closed_issues,
+            'open_issues': aggregate['open'],
+            'progress_percentage': progress_percentage,
+            'current_phase': current_phase,
+            'last_updated': aggregate['latest_update']
+        }
+    
+    def _get_project_issues(self, project_data: Dict) -> List[Dict]:
+        """Fetch only this project's issues, most recently updated first"""
+        project_label = f"project-{project_data['index_number']}"
+        now = time.monotonic()
+        with self._issues_lock:
+            cached = self._issues_cache.get(project_label)
+        if cached and now - cached[0] < self.issues_ttl:
+            return cached[1]
+        
+        issues = self.github.list_issues_graphql(self.org, self.repo_name, [project_label])
+        if issues is None:
+            # REST fallback, still filtered by label on the server
+            logger.warning(f"GraphQL issue listing failed for {project_label}, using REST")
+            issues = self.github.list_issues(self.org, self.repo_name, state='all', labels=[project_label])
+            issues.sort(key=lambda issue: issue.get('updated_at') or '', reverse=True)
+        
+        with self._issues_lock:
+            self._issues_cache[project_label] = (now, issues)
+        return issues
+    
     def _determine_current_phase(self, progress_percentage: float, issues: List[Dict]) -> str:
         """Determine current project phase based on progress and issues"""
         if progress_percentage == 0:
@@ -216,7 +370,8 @@ class StudentProjectManager:
             'final': 'Final Evaluation'
         }
         
-        recent_activity = issues[:3] if issues else []  # Most recent issues
+        # Most recent issues, without relying on the listing's order
+        recent_activity = heapq.nlargest(3, issues, key=lambda issue: issue.get('updated_at') or '')
         
         for issue in recent_activity:
             issue_title = issue['title'].lower()
@@ -237,97 +392,96 @@ class StudentProjectManager:
     def get_project_project_stats(self, project_data: Dict) -> Dict:
         """Get detailed statistics for project project"""
         try:
-            project_label = f"project-{project_data['index_number']}"
-            all_issues = self.github.list_issues(self.org, self.repo_name)
-            project_issues = [issue for issue in all_issues 
-                            if any(label['name'] == project_label for label in issue.get('labels', []))]
-            
-            # Calculate detailed metrics
-            total_issues = len(project_issues)
-            open_issues = [i for i in project_issues if i['state'] == 'open']
-            closed_issues = [i for i in project_issues if i['state'] == 'closed']
-            
-            # Get milestone-specific progress
-            milestone_progress = self._calculate_milestone_progress(project_issues)
-            
-            return {
-                'project_id': project_data['index_number'],
-                'project_folder': f"projects/{project_data['index_number']}",
-                'total_issues': total_issues,
-                'open_issues': len(open_issues),
-                'closed_issues': len(closed_issues),
-                'progress_percentage': (len(closed_issues) / max(total_issues, 1)) * 100,
-                'milestone_progress': milestone_progress,
-                'has_recent_activity': self._check_recent_activity(project_issues)
-            }
+            project_issues = self._get_project_issues(project_data)
+            return self._stats_view(project_data, project_issues, self._aggregate_issues(project_issues))
             
         except Exception as e:
             logger.error(f"Failed to get stats for {project_data['index_number']}: {e}")
             return {'project_id': project_data['index_number'], 'error': str(e)}
     
-    def _calculate_milestone_progress(self, issues: List[Dict]) -> Dict:
-        """Calculate progress for each milestone"""
+    def _stats_view(self, project_data: Dict, project_issues: List[Dict], aggregate: Dict) -> Dict:
+        """Detailed statistics, milestone progress included, from an aggregated issue list"""
+        return {
+            'project_id': project_data['index_number'],
+            'project_folder': f"projects/{project_data['index_number']}",
+            'total_issues': aggregate['total'],
+            'open_issues': aggregate['open'],
+            'closed_issues': aggregate['closed'],
+            'progress_percentage': (aggregate['closed'] / max(aggregate['total'], 1)) * 100,
+            'milestone_progress': aggregate['milestones'],
+            'has_recent_activity': self._check_recent_activity(aggregate['latest_update'])
+        }
+    
+    def _aggregate_issues(self, issues: List[Dict]) -> Dict:
+        """Count issues, states and per-milestone progress in a single pass"""
         milestones = {
             'Literature Review': {'total': 0, 'completed': 0},
             'Implementation': {'total': 0, 'completed': 0}, 
             'Mid Evaluation': {'total': 0, 'completed': 0},
             'Final Evaluation': {'total': 0, 'completed': 0}
         }
+        closed = 0
+        latest_update = None
         
         for issue in issues:
-            title = issue['title'].lower()
-            labels = [label['name'].lower() for label in issue.get('labels', [])]
+            is_closed = issue['state'] == 'closed'
+            closed += is_closed
             
-            # Categorize issues by milestone
-            if 'literature' in title or 'literature-review' in labels:
-                milestone = 'Literature Review'
-            elif 'implementation' in title or 'methodology' in title or 'implementation' in labels:
-                milestone = 'Implementation'
-            elif 'mid' in title or 'mid-evaluation' in labels:
-                milestone = 'Mid Evaluation'
-            elif 'final' in title or 'final-evaluation' in labels:
-                milestone = 'Final Evaluation'
-            else:
-                continue  # Skip uncategorized issues
+            updated_at = issue.get('updated_at')
+            if updated_at and (latest_update is None or updated_at > latest_update):
+                latest_update = updated_at
             
-            milestones[milestone]['total'] += 1
-            if issue['state'] == 'closed':
-                milestones[milestone]['completed'] += 1
+            milestone = self._classify_milestone(issue)
+            if milestone is not None:
+                milestones[milestone]['total'] += 1
+                milestones[milestone]['completed'] += is_closed
         
         # Calculate percentages
-        for milestone in milestones:
-            total = milestones[milestone]['total']
-            completed = milestones[milestone]['completed']
-            milestones[milestone]['percentage'] = (completed / max(total, 1)) * 100
+        for counts in milestones.values():
+            counts['percentage'] = (counts['completed'] / max(counts['total'], 1)) * 100
         
-        return milestones
+        return {
+            'total': len(issues),
+            'closed': closed,
+            'open': len(issues) - closed,
+            'milestones': milestones,
+            'latest_update': latest_update
+        }
     
-    def _check_recent_activity(self, issues: List[Dict]) -> bool:
-        """Check if there has been recent activity (within last 7 days)"""
-        import datetime
+    def _classify_milestone(self, issue: Dict) -> Optional[str]:
+        """Milestone an issue belongs to, from its title and labels"""
+        labels = {label['name'].lower() for label in issue.get('labels', ())}
+        title = issue['title'].lower()
         
-        if not issues:
+        # First matching rule wins, by label or by title keyword
+        for milestone, label, keywords in _MILESTONE_RULES:
+            if label in labels or any(keyword in title for keyword in keywords):
+                return milestone
+        return None  # Uncategorized issue
+    
+    @staticmethod
+    def _check_recent_activity(latest_update: Optional[str], days: int = 7) -> bool:
+        """Check if there has been recent activity (within last 7 days)"""
+        if not latest_update:
             return False
         
-        # Get most recent issue update
-        latest_update = issues[0]['updated_at']
-        
         # Parse date and check if within last 7 days
         try:
-            from datetime import datetime, timedelta
-            latest_date = datetime.strptime(latest_update, '%Y-%m-%dT%H:%M:%SZ')
-            week_ago = datetime.now() - timedelta(days=7)
+            latest_date = datetime.fromisoformat(latest_update.replace('Z', '+00:00'))
+            week_ago = datetime.now(timezone.utc) - timedelta(days=days)
             return latest_date > week_ago
-        except:
+        except (TypeError, ValueError):
             return False
     
     def generate_project_report(self, project_data: Dict) -> Dict:
         """Generate comprehensive report for individual project"""
         try:
-            stats = self.get_project_project_stats(project_data)
-            progress = self.update_project_progress(project_data)
+            # One fetch and one aggregation pass feed both halves of the report
+            project_issues = self._get_project_issues(project_data)
+            aggregate = self._aggregate_issues(project_issues)
+            stats = self._stats_view(project_data, project_issues, aggregate)
+            progress = self._progress_view(project_data, project_issues, aggregate)
             
-            from datetime import datetime
             return {
                 'project_info': project_data,
                 'folder_path': f"projects/{project_data['index_number']}",
@@ -341,6 +495,27 @@ class StudentProjectManager:
             logger.error(f"Failed to generate report for {project_data['index_number']}: {e}")
             return {'error': str(e)}
     
+    def generate_all_reports(self, projects: List[Dict]) -> List[Dict]:
+        """Generate reports for many projects from one issue listing, in input order"""
+        labels = [f"project-{project['index_number']}" for project in projects]
+        
+        # One query for every project's issues, bucketed by label into the per-project cache
+        issues = self.github.list_issues_graphql(self.org, self.repo_name, labels) if labels else []
+        if issues is not None:
+            buckets = {label: [] for label in labels}
+            for issue in issues:
+                for label in issue.get('labels', ()):
+                    bucket = buckets.get(label['name'])
+                    if bucket is not None:
+                        bucket.append(issue)
+            
+            now = time.monotonic()
+            with self._issues_lock:
+                self._issues_cache.update((label, (now, bucket)) for label, bucket in buckets.items())
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.generate_project_report, projects))
+    
     def _generate_recommendations(self, stats: Dict, progress: Dict) -> List[str]:
         """Generate recommendations based on project progress"""
         recommendations = []
@@ -370,92 +545,13 @@ class StudentProjectManager:
     
     def _generate_project_readme(self, project_data: Dict) -> str:
         """Generate README template for project folder"""
-        return f"""# Research Project - {project_data['index_number']}
-
-**project:** {project_data['index_number']}  
-**Research Area:** {project_data['research_area']}  
-**Email:** {project_data['email']}  
-**GitHub:** @{project_data.get('github_username', 'N/A')}
-
-## Project Structure
-
-```
-{project_data['index_number']}/
-├── README.md              # This file
-├── docs/                  # Documentation and reports
-│   ├── literature_review.md
-│   ├── methodology.md
-│   ├── mid_report.md
-│   └── final_paper.md
-├── src/                   # Source code
-├── data/                  # Datasets
-├── results/               # Experimental results
-└── requirements.txt       # Dependencies
-```
-
-## Milestones
-
-- [ ] **Week 4:** Literature Review
-- [ ] **Week 8:** Methodology & Implementation
-- [ ] **Week 10:** Mid Evaluation
-- [ ] **Week 16:** Final Evaluation
-
-## Progress Tracking
-
-Track your progress using GitHub Issues with label `project-{project_data['index_number']}`.
-
-## Getting Started
-
-1. Update this README with your specific project details
-2. Complete the literature review in `docs/literature_review.md`
-3. Add your code to `src/` folder
-4. Update progress through GitHub Issues
-
----
-*Generated automatically by GitHub Research Project Manager*
-"""
+        return _PROJECT_README_TEMPLATE.format_map({
+            'index_number': project_data['index_number'],
+            'research_area': project_data['research_area'],
+            'email': project_data['email'],
+            'github_username': project_data.get('github_username', 'N/A')
+        })
     
     def _generate_literature_template(self) -> str:
         """Generate literature review template"""
-        return """# Literature Review
-
-## Abstract
-
-Brief summary of your literature review findings.
-
-## Introduction
-
-Background and context of your research area.
-
-## Related Work
-
-### Category 1: [Topic Area]
-
-- **Paper 1:** Author et al. (Year). Title. Venue. 
-  - Key findings:
-  - Limitations:
-  
-- **Paper 2:** Author et al. (Year). Title. Venue.
-  - Key findings:
-  - Limitations:
-
-### Category 2: [Topic Area]
-
-[Continue with more papers...]
-
-## Research Gaps
-
-Identify gaps in current research that your project will address.
-
-## Methodology
-
-Proposed approach based on literature analysis.
-
-## References
-
-[Add your references here in standard format]
-
----
-*Update this document as you progress through your literature review*
-"""
-
+        return _LITERATURE_TEMPLATE
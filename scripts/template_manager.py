@@ -4,21 +4,44 @@ Template Manager for automated README and template deployment
 """
 
 import os
+import re
 import logging
 from typing import Dict, List, Optional
 from pathlib import Path
 import json
 from datetime import datetime
+from functools import lru_cache
 
 from .utils import load_project_data, save_progress_data
 from .repo_manager import RepositoryManager
 
+_PLACEHOLDER_RE = re.compile(r'\{([A-Z_][A-Z0-9_]*)\}')
+
+@lru_cache(maxsize=256)
+def _read_template(full_path: Path) -> str:
+    """Read a template file once per run"""
+    if not full_path.exists():
+        raise FileNotFoundError(f"Template not found: {full_path}")
+    
+    with open(full_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@lru_cache(maxsize=32)
+def _list_templates(directory: Path) -> frozenset:
+    """Names of the template files in a directory, scanned once per run"""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except FileNotFoundError:
+        return frozenset()
+
 class TemplateManager:
     def __init__(self, config: Dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.repo_manager = RepositoryManager(config)
         self.templates_dir = Path('templates')
+        self.batch_size = config.get('bulk_processing', {}).get('batch_size', 10)
         
     def deploy_all_templates(self, projects_file: str) -> Dict:
         """Deploy all templates to repository and student folders"""
@@ -36,10 +59,14 @@ class TemplateManager:
             else:
                 results['failed'].append(main_result)
             
-            # Deploy student folder templates
+            # Deploy student folder templates, one commit per batch of students
             projects = load_project_data(projects_file)
-            for project in projects:
-                student_result = self.deploy_student_templates(project)
+            student_results = []
+            batch_size = max(1, self.batch_size)
+            for i in range(0, len(projects), batch_size):
+                student_results.extend(self._deploy_student_batch(projects[i:i + batch_size]))
+            
+            for student_result in student_results:
                 if student_result['status'] == 'success':
                     results['successful'].append(student_result)
                 else:
@@ -78,19 +105,23 @@ class TemplateManager:
             })
             
             # Create/update README.md
-            success = self.repo_manager.create_or_update_file(
+            success = self.repo_manager.create_file_in_repo(
                 'README.md', 
                 readme_content, 
-                'Deploy main repository README template'
+                'Deploy main repository README template',
+                log_level=logging.INFO,
+                update_message='Deploy main repository README template'
             )
             
             if success:
                 # Deploy project structure documentation
                 structure_content = self._load_template('repository/project_structure.md')
-                self.repo_manager.create_or_update_file(
+                self.repo_manager.create_file_in_repo(
                     'docs/project_structure.md',
                     structure_content,
-                    'Add project structure documentation'
+                    'Add project structure documentation',
+                    log_level=logging.INFO,
+                    update_message='Add project structure documentation'
                 )
                 
                 return {'status': 'success', 'operation': 'main_repo_templates', 'files_deployed': ['README.md', 'docs/project_structure.md']}
@@ -100,43 +131,85 @@ class TemplateManager:
         except Exception as e:
             return {'status': 'failed', 'operation': 'main_repo_templates', 'error': str(e)}
     
+    def _student_template_files(self, project: Dict) -> tuple:
+        """Render a student's templates, returns (files, templates_deployed)"""
+        index_number = project['index_number']
+        folder_path = f"projects/{index_number}"
+        
+        # Deploy student README
+        readme_content = self._load_template('documentation/usage_instructions.md')
+        readme_content = self._substitute_placeholders(readme_content, {
+            'STUDENT_NAME': project.get('student_name', 'Student Name'),
+            'INDEX_NUMBER': index_number,
+            'RESEARCH_AREA': project.get('research_area', 'Research Area'),
+            'SUPERVISOR_NAME': project.get('supervisor', 'Supervisor Name'),
+            'START_DATE': datetime.now().strftime('%Y-%m-%d')
+        })
+        
+        files = [(f"{folder_path}/README.md", readme_content)]
+        templates_deployed = ['README.md']
+        
+        # Deploy methodology template
+        if self._has_template('documentation/methodology.md'):
+            files.append((f"{folder_path}/docs/methodology.md", self._load_template('documentation/methodology.md')))
+            templates_deployed.append('docs/methodology.md')
+        
+        return files, templates_deployed
+    
+    def _deploy_student_batch(self, projects: List[Dict]) -> List[Dict]:
+        """Deploy templates for a batch of students in a single commit"""
+        results = []
+        files = []
+        rendered = []
+        for project in projects:
+            try:
+                student_files, templates_deployed = self._student_template_files(project)
+                files.extend(student_files)
+                rendered.append((project, templates_deployed))
+            except Exception as e:
+                results.append({
+                    'status': 'failed',
+                    'operation': 'student_templates',
+                    'student': project,
+                    'error': str(e)
+                })
+        
+        if not rendered:
+            return results
+        
+        index_numbers = ', '.join(str(project['index_number']) for project, _ in rendered)
+        try:
+            success = self.repo_manager.commit_changed_files(files, f"Add templates for {index_numbers}")
+        except Exception as e:
+            self.logger.error(f"Failed to commit templates for {index_numbers}: {e}")
+            success = False
+        
+        if not success:
+            # One bad file should not fail the whole batch, so fall back to a commit per student
+            self.logger.warning(f"Batch commit failed, retrying templates for {index_numbers} one student at a time")
+            results.extend(self.deploy_student_templates(project) for project, _ in rendered)
+            return results
+        
+        for project, templates_deployed in rendered:
+            results.append({
+                'status': 'success',
+                'operation': 'student_templates',
+                'student': project,
+                'templates_deployed': templates_deployed
+            })
+        
+        return results
+    
     def deploy_student_templates(self, project: Dict) -> Dict:
         """Deploy templates to individual student folders"""
         try:
             index_number = project['index_number']
-            folder_path = f"projects/{index_number}"
+            files, templates_deployed = self._student_template_files(project)
             
-            # Deploy student README
-            readme_content = self._load_template('documentation/usage_instructions.md')
-            readme_content = self._substitute_placeholders(readme_content, {
-                'STUDENT_NAME': project.get('student_name', 'Student Name'),
-                'INDEX_NUMBER': index_number,
-                'RESEARCH_AREA': project.get('research_area', 'Research Area'),
-                'SUPERVISOR_NAME': project.get('supervisor', 'Supervisor Name'),
-                'START_DATE': datetime.now().strftime('%Y-%m-%d')
-            })
-            
-            # Create student folder README
-            success = self.repo_manager.create_or_update_file(
-                f"{folder_path}/README.md",
-                readme_content,
-                f"Add README template for {index_number}"
-            )
+            # All of the student's templates go in as one commit
+            success = self.repo_manager.commit_changed_files(files, f"Add templates for {index_number}")
             
             if success:
-                # Deploy other student templates
-                templates_deployed = ['README.md']
-                
-                # Deploy methodology template
-                if self.templates_dir.joinpath('documentation/methodology.md').exists():
-                    methodology_content = self._load_template('documentation/methodology.md')
-                    self.repo_manager.create_or_update_file(
-                        f"{folder_path}/docs/methodology.md",
-                        methodology_content,
-                        f"Add methodology template for {index_number}"
-                    )
-                    templates_deployed.append('docs/methodology.md')
-                
                 return {
                     'status': 'success', 
                     'operation': 'student_templates',
@@ -148,7 +221,7 @@ class TemplateManager:
                     'status': 'failed', 
                     'operation': 'student_templates',
                     'student': project,
-                    'error': 'Failed to create student README'
+                    'error': 'Failed to commit student templates'
                 }
                 
         except Exception as e:
@@ -165,12 +238,14 @@ class TemplateManager:
             templates_deployed = []
             
             # Deploy progress report template
-            if self.templates_dir.joinpath('issues/progress_report.md').exists():
+            if self._has_template('issues/progress_report.md'):
                 progress_template = self._load_template('issues/progress_report.md')
-                success = self.repo_manager.create_or_update_file(
+                success = self.repo_manager.create_file_in_repo(
                     '.github/ISSUE_TEMPLATE/progress_report.md',
                     progress_template,
-                    'Add progress report issue template'
+                    'Add progress report issue template',
+                    log_level=logging.INFO,
+                    update_message='Add progress report issue template'
                 )
                 if success:
                     templates_deployed.append('progress_report.md')
@@ -178,13 +253,14 @@ class TemplateManager:
             # Deploy other issue templates
             issue_templates = ['literature_review.md', 'methodology.md', 'mid_evaluation.md', 'final_evaluation.md']
             for template_name in issue_templates:
-                template_path = self.templates_dir.joinpath(f'issues/{template_name}')
-                if template_path.exists():
+                if self._has_template(f'issues/{template_name}'):
                     template_content = self._load_template(f'issues/{template_name}')
-                    success = self.repo_manager.create_or_update_file(
+                    success = self.repo_manager.create_file_in_repo(
                         f'.github/ISSUE_TEMPLATE/{template_name}',
                         template_content,
-                        f'Add {template_name} issue template'
+                        f'Add {template_name} issue template',
+                        log_level=logging.INFO,
+                        update_message=f'Add {template_name} issue template'
                     )
                     if success:
                         templates_deployed.append(template_name)
@@ -204,15 +280,14 @@ class TemplateManager:
     
     def _load_template(self, template_path: str) -> str:
         """Load template file content"""
+        return _read_template(self.templates_dir.joinpath(template_path))
+    
+    def _has_template(self, template_path: str) -> bool:
+        """Check if template file exists"""
         full_path = self.templates_dir.joinpath(template_path)
-        if not full_path.exists():
-            raise FileNotFoundError(f"Template not found: {full_path}")
-        
-        with open(full_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return full_path.name in _list_templates(full_path.parent)
     
     def _substitute_placeholders(self, content: str, placeholders: Dict) -> str:
         """Substitute placeholders in template content"""
-        for placeholder, value in placeholders.items():
-            content = content.replace(f'{{{placeholder}}}', str(value))
-        return content
\ No newline at end of file
+        values = {placeholder: str(value) for placeholder, value in placeholders.items()}
+        return _PLACEHOLDER_RE.sub(lambda m: values.get(m.group(1), m.group(0)), content)
\ No newline at end of file
@@ -5,19 +5,43 @@ Utility functions for the GitHub project management system
 import json
 import csv
 import os
+import re
+import time
+import shutil
+import atexit
+import queue
 import logging
-from typing import Dict, List, Any, Optional
+import logging.handlers
+from typing import Dict, List, Any, Optional, Iterator, Iterable
 from datetime import datetime, timedelta
 import hashlib
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+from .exceptions import RateLimitExceeded
+
+try:
+    import orjson
+except ImportError:  # Optional, the standard json module is used without it
+    orjson = None
+
+try:
+    import blake3
+except ImportError:  # Optional, only needed for get_file_hash(..., algorithm='blake3')
+    blake3 = None
 
 logger = logging.getLogger(__name__)
 
-# Add this function right after the existing imports at the top of utils.py
+# Patterns are compiled once at import; the username one covers http, https and bare github.com URLs
+_GITHUB_USERNAME_RE = re.compile(r'(?:https?://)?github\.com/([^/?#\s]+)', re.IGNORECASE)
 
+# Fixed single-character replacements use translate tables rather than regexes
+_CLEAN_FOLDER_TRANS = str.maketrans({' ': '-', '_': '-'})
+_SANITIZE_FILENAME_TRANS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+@lru_cache(maxsize=4096)
 def extract_github_username(github_value: str) -> str:
     """Extract GitHub username from URL or return as-is if already a username"""
-    import re
-    
     if not github_value:
         return ""
     
@@ -28,20 +52,10 @@ def extract_github_username(github_value: str) -> str:
     if not github_value.startswith(('http://', 'https://', 'github.com')):
         return github_value
     
-    # Extract username from GitHub URL patterns
-    patterns = [
-        r'https://github\.com/([^/?#\s]+)',
-        r'http://github\.com/([^/?#\s]+)',
-        r'github\.com/([^/?#\s]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, github_value, re.IGNORECASE)
-        if match:
-            username = match.group(1).strip()
-            # Remove any trailing slashes or special characters
-            username = username.rstrip('/')
-            return username
+    # Extract username from GitHub URL
+    match = _GITHUB_USERNAME_RE.search(github_value)
+    if match:
+        return match.group(1)
     
     # If no pattern matches, return the original value cleaned
     return github_value
@@ -183,47 +197,75 @@ def validate_repository_access(config: Dict) -> Dict:
 #         logger.error(f"Error loading project data: {e}")
 #         raise
 
+# CSV columns read for each project record, in field order below
+_PROJECT_COLUMNS = ('Student_ID', 'Student_Name', 'Research_Area', 'Mail', 'GitHub_User_Name')
+
+def iter_project_data(csv_path: str) -> Iterator[Dict]:
+    """Yield validated project records from CSV file one row at a time"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        
+        # Column positions are resolved once from the header instead of per-row dict lookups
+        positions = {name: i for i, name in enumerate(header)}
+        indices = [positions.get(column) for column in _PROJECT_COLUMNS]
+        
+        for values in reader:
+            if not values:
+                continue
+            
+            # Based on your CSV structure: Student_Name,Student_ID,Research_Area,GitHub_User_Name,Mail
+            student_id, student_name, research_area, mail, github_value = (
+                values[i].strip() if i is not None and i < len(values) else '' for i in indices
+            )
+            
+            # In the project dictionary, ensure these fields exist:
+            project = {
+                'index_number': student_id,
+                'Student_ID': student_id,  # Keep original for backward compatibility
+                'student_name': student_name,
+                'Student_Name': student_name,  # Keep original
+                'research_area': research_area,
+                'email': mail,
+                'github_username': extract_github_username(github_value),
+                'GitHub_User_Name': github_value  # Keep original
+            }
+            
+            # Validate required fields
+            if not project['index_number'] or not project['research_area']:
+                logger.warning(f"Skipping invalid project record: {dict(zip(header, values))}")
+                continue
+            
+            # Additional validation for GitHub username
+            if not project['github_username']:
+                logger.warning(f"No GitHub username for project {project['index_number']}")
+                # You can choose to skip or continue without GitHub username
+                # For now, we'll continue but log the warning
+            
+            # Clean research area for folder naming
+            project['research_area_clean'] = clean_folder_name(project['research_area'])
+            
+            yield project
+
+# Parsed CSV rows per path, reused until the file's mtime or size changes
+_project_data_cache: Dict[str, tuple] = {}
+
 def load_project_data(csv_path: str) -> List[Dict]:
     """Load project data from CSV file"""
-    projects = []
-    
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                # Map CSV column names to expected field names
-                # Based on your CSV structure: Student_Name,Student_ID,Research_Area,GitHub_User_Name,Mail
-                # In the project dictionary, ensure these fields exist:
-                project = {
-                    'index_number': row.get('Student_ID', '').strip(),
-                    'Student_ID': row.get('Student_ID', '').strip(),  # Keep original for backward compatibility
-                    'student_name': row.get('Student_Name', '').strip(),
-                    'Student_Name': row.get('Student_Name', '').strip(),  # Keep original
-                    'research_area': row.get('Research_Area', '').strip(),
-                    'email': row.get('Mail', '').strip(),
-                    'github_username': extract_github_username(row.get('GitHub_User_Name', '').strip()),
-                    'GitHub_User_Name': row.get('GitHub_User_Name', '').strip()  # Keep original
-                }
-                
-                # Validate required fields
-                if not project['index_number'] or not project['research_area']:
-                    logger.warning(f"Skipping invalid project record: {row}")
-                    continue
-                
-                # Additional validation for GitHub username
-                if not project['github_username']:
-                    logger.warning(f"No GitHub username for project {project['index_number']}")
-                    # You can choose to skip or continue without GitHub username
-                    # For now, we'll continue but log the warning
-                
-                # Clean research area for folder naming
-                project['research_area_clean'] = clean_folder_name(project['research_area'])
-                
-                projects.append(project)
+        stat = os.stat(csv_path)
+        file_signature = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = _project_data_cache.get(csv_path)
+        if cached and cached[0] == file_signature:
+            projects = cached[1]
+        else:
+            projects = list(iter_project_data(csv_path))
+            _project_data_cache[csv_path] = (file_signature, projects)
+            logger.info(f"Loaded {len(projects)} projects from {csv_path}")
         
-        logger.info(f"Loaded {len(projects)} projects from {csv_path}")
-        return projects
+        # Callers annotate project dicts in place, so hand out copies
+        return [dict(project) for project in projects]
         
     except FileNotFoundError:
         logger.error(f"Project data file not found: {csv_path}")
@@ -232,6 +274,9 @@ def load_project_data(csv_path: str) -> List[Dict]:
         logger.error(f"Error loading project data: {e}")
         raise
 
+# Parsed supervisors.json, reused until the file's mtime or size changes
+_supervisor_data_cache: Dict[str, tuple] = {}
+
 def load_supervisor_data(config: Dict) -> List[Dict]:
     """Load supervisor data from configuration"""
     try:
@@ -240,15 +285,25 @@ def load_supervisor_data(config: Dict) -> List[Dict]:
         # Load from supervisors.json if exists
         supervisors_path = 'config/supervisors.json'
         if os.path.exists(supervisors_path):
-            with open(supervisors_path, 'r', encoding='utf-8') as f:
-                supervisor_config = json.load(f)
-                supervisors.extend(supervisor_config.get('supervisors', []))
-                
-                # Add module coordinator
-                if 'module_coordinator' in supervisor_config:
-                    coordinator = supervisor_config['module_coordinator']
-                    coordinator['role'] = 'module_coordinator'
-                    supervisors.append(coordinator)
+            stat = os.stat(supervisors_path)
+            file_signature = (stat.st_mtime_ns, stat.st_size)
+            
+            cached = _supervisor_data_cache.get(supervisors_path)
+            if cached and cached[0] == file_signature:
+                supervisor_config = cached[1]
+            else:
+                with open(supervisors_path, 'r', encoding='utf-8') as f:
+                    supervisor_config = json.load(f)
+                _supervisor_data_cache[supervisors_path] = (file_signature, supervisor_config)
+            
+            # Hand out copies so callers cannot change the cached records
+            supervisors.extend(dict(supervisor) for supervisor in supervisor_config.get('supervisors', []))
+            
+            # Add module coordinator
+            if 'module_coordinator' in supervisor_config:
+                coordinator = dict(supervisor_config['module_coordinator'])
+                coordinator['role'] = 'module_coordinator'
+                supervisors.append(coordinator)
         
         # Fallback to config file
         if not supervisors and 'supervisors' in config:
@@ -260,13 +315,25 @@ def load_supervisor_data(config: Dict) -> List[Dict]:
         logger.error(f"Error loading supervisor data: {e}")
         return []
 
+# Research areas become folder names: spaces and slashes turn into dashes
+_FOLDER_NAME_TRANS = str.maketrans({' ': '-', '/': '-'})
+
+def folder_slug(research_area: str) -> str:
+    """Research area as it appears in project folder names"""
+    return research_area.translate(_FOLDER_NAME_TRANS)
+
+def project_folder_name(student: Dict) -> str:
+    """Folder name of a student's project under projects/"""
+    return f"{student['index_number']}-{folder_slug(student['research_area'])}"
+
+@lru_cache(maxsize=4096)
 def clean_folder_name(name: str) -> str:
     """Clean name for folder naming"""
     # Replace spaces and special characters with hyphens for better readability
-    cleaned = name.replace(' ', '-').replace('_', '-')
-    # Remove multiple hyphens
-    import re
-    cleaned = re.sub(r'-+', '-', cleaned)
+    cleaned = name.translate(_CLEAN_FOLDER_TRANS)
+    # Remove multiple hyphens; each replace halves a run, and most names have none
+    while '--' in cleaned:
+        cleaned = cleaned.replace('--', '-')
     # Remove leading/trailing hyphens
     cleaned = cleaned.strip('-')
     # Ensure it's not empty
@@ -310,9 +377,14 @@ def create_folder_structure(base_path: str, project: Dict, config: Dict) -> Dict
     }
     
     try:
-        # Create directories
+        # Create directories: the project folder walks its parents once, subfolders are plain mkdirs
+        os.makedirs(project_folder, exist_ok=True)
         for folder_type, folder_path in folders.items():
-            os.makedirs(folder_path, exist_ok=True)
+            if folder_type != 'main':
+                try:
+                    os.mkdir(folder_path)
+                except FileExistsError:
+                    pass
             logger.debug(f"Created folder: {folder_path}")
         
         # Create initial files
@@ -325,34 +397,37 @@ def create_folder_structure(base_path: str, project: Dict, config: Dict) -> Dict
         logger.error(f"Error creating folder structure: {e}")
         raise
 
+_GITKEEP_BYTES = b'# This file keeps the folder in git\n'
+
+@lru_cache(maxsize=1)
+def _static_project_files() -> tuple:
+    """Encoded requirements.txt and structure guide, identical for every project"""
+    return get_requirements_template({}).encode('utf-8'), get_project_structure_guide().encode('utf-8')
+
 def create_initial_project_files(folders: Dict[str, str], project: Dict, config: Dict):
     """Create initial files for project project"""
     try:
+        requirements_bytes, structure_bytes = _static_project_files()
+        
         # Create README.md
         readme_content = generate_project_readme(project, config)
-        readme_path = os.path.join(folders['main'], 'README.md')
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        with open(os.path.join(folders['main'], 'README.md'), 'wb') as f:
+            f.write(readme_content.encode('utf-8'))
         
         # Create .gitkeep files in empty directories
         gitkeep_folders = ['data', 'results', 'references']
         for folder_name in gitkeep_folders:
             if folder_name in folders:
-                gitkeep_path = os.path.join(folders[folder_name], '.gitkeep')
-                with open(gitkeep_path, 'w') as f:
-                    f.write('# This file keeps the folder in git\n')
+                with open(os.path.join(folders[folder_name], '.gitkeep'), 'wb') as f:
+                    f.write(_GITKEEP_BYTES)
         
         # Create requirements.txt template
-        requirements_path = os.path.join(folders['main'], 'requirements.txt')
-        requirements_content = get_requirements_template(config)
-        with open(requirements_path, 'w', encoding='utf-8') as f:
-            f.write(requirements_content)
+        with open(os.path.join(folders['main'], 'requirements.txt'), 'wb') as f:
+            f.write(requirements_bytes)
         
         # Create project structure guide
-        structure_path = os.path.join(folders['docs'], 'project_structure.md')
-        structure_content = get_project_structure_guide()
-        with open(structure_path, 'w', encoding='utf-8') as f:
-            f.write(structure_content)
+        with open(os.path.join(folders['docs'], 'project_structure.md'), 'wb') as f:
+            f.write(structure_bytes)
             
     except Exception as e:
         logger.error(f"Error creating initial files: {e}")
@@ -486,14 +561,25 @@ This document explains how to organize your research project files.
 - Documentation: `UPPERCASE.md` for important docs
 """
 
-def save_progress_data(data: Dict, filename: str, directory: str = 'data/progress'):
-    """Save progress data to JSON file"""
+def save_progress_data(data: Dict, filename: str, directory: str = 'data/progress', pretty: bool = True):
+    """Save progress data to JSON file, compact when pretty is False"""
     try:
         os.makedirs(directory, exist_ok=True)
         filepath = os.path.join(directory, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
+        if orjson is not None:
+            # Datetimes go through default=str as with json, so the files read the same
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            payload = orjson.dumps(data, default=str, option=option)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+        else:
+            # Files only other scripts read skip the indentation
+            layout = {'indent': 2} if pretty else {'separators': (',', ':')}
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, default=str, **layout)
         
         logger.debug(f"Saved progress data to {filepath}")
         
@@ -508,8 +594,15 @@ def load_progress_data(filename: str, directory: str = 'data/progress') -> Dict:
         if not os.path.exists(filepath):
             return {}
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # Older files written by json may hold NaN/Infinity, which orjson rejects
+        return json.loads(raw)
             
     except Exception as e:
         logger.error(f"Error loading progress data: {e}")
@@ -523,15 +616,19 @@ def calculate_progress_percentage(issues: List[Dict], milestones: Dict) -> float
     total_weight = 0
     completed_weight = 0
     
+    # Lowercased keys are built once; issues share a few milestone titles, so each title is matched once
+    milestone_weights = [(key.lower(), data.get('weight', 1)) for key, data in milestones.items()]
+    title_weights = {}
+    
     for issue in issues:
-        milestone_title = issue.get('milestone', {}).get('title', '').lower() if issue.get('milestone') else 'other'
+        milestone = issue.get('milestone')
+        milestone_title = milestone.get('title', '').lower() if milestone else 'other'
         
-        # Find milestone weight
-        weight = 1  # Default weight
-        for milestone_key, milestone_data in milestones.items():
-            if milestone_key.lower() in milestone_title:
-                weight = milestone_data.get('weight', 1)
-                break
+        # Find milestone weight, first matching key wins
+        weight = title_weights.get(milestone_title)
+        if weight is None:
+            weight = next((w for key, w in milestone_weights if key in milestone_title), 1)
+            title_weights[milestone_title] = weight
         
         total_weight += weight
         
@@ -545,17 +642,21 @@ def calculate_progress_percentage(issues: List[Dict], milestones: Dict) -> float
 
 def get_milestone_status(issues: List[Dict], milestone_name: str) -> str:
     """Get status of specific milestone"""
-    milestone_issues = [
-        issue for issue in issues 
-        if issue.get('milestone', {}).get('title', '').lower().find(milestone_name.lower()) != -1
-    ]
+    milestone_name = milestone_name.lower()
     
-    if not milestone_issues:
-        return 'not_started'
+    # Count matching and closed issues in one pass
+    total_count = 0
+    closed_count = 0
+    for issue in issues:
+        milestone = issue.get('milestone')
+        if milestone_name in (milestone.get('title', '').lower() if milestone else ''):
+            total_count += 1
+            closed_count += issue.get('state') == 'closed'
     
-    closed_count = sum(1 for issue in milestone_issues if issue.get('state') == 'closed')
+    if not total_count:
+        return 'not_started'
     
-    if closed_count == len(milestone_issues):
+    if closed_count == total_count:
         return 'completed'
     elif closed_count > 0:
         return 'in_progress'
@@ -569,7 +670,11 @@ def format_datetime(dt: datetime) -> str:
 def parse_datetime(dt_string: str) -> Optional[datetime]:
     """Parse datetime string"""
     try:
-        return datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
+        # Python 3.11+ parses a trailing 'Z' itself; older versions need the explicit offset
+        try:
+            return datetime.fromisoformat(dt_string)
+        except ValueError:
+            return datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
     except Exception:
         return None
 
@@ -586,8 +691,8 @@ def create_backup(source_file: str, backup_dir: str = 'data/backups'):
         backup_filename = f"{timestamp}_{filename}"
         backup_path = os.path.join(backup_dir, backup_filename)
         
-        import shutil
-        shutil.copy2(source_file, backup_path)
+        # The timestamp is in the name, so file metadata is not copied; copyfile uses the kernel fast path
+        shutil.copyfile(source_file, backup_path)
         
         logger.debug(f"Created backup: {backup_path}")
         
@@ -620,8 +725,21 @@ def validate_config(config: Dict) -> List[str]:
     
     return errors
 
+# Listener and root queue handler installed by setup_logging, replaced if it is called again
+_log_listener = None
+_log_queue_handler = None
+
+def _stop_log_listener():
+    """Flush and stop the logging listener thread"""
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+
 def setup_logging(log_level: str = 'INFO', log_file: str = None):
-    """Setup logging configuration"""
+    """Setup logging configuration, a later call replaces the earlier setup"""
+    global _log_listener, _log_queue_handler
+    
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
     # Create logs directory
@@ -632,70 +750,103 @@ def setup_logging(log_level: str = 'INFO', log_file: str = None):
     if log_file:
         handlers.append(logging.FileHandler(f'logs/{log_file}'))
     
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format=log_format,
-        handlers=handlers
-    )
+    formatter = logging.Formatter(log_format)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    root = logging.getLogger()
+    if _log_queue_handler is not None:
+        root.removeHandler(_log_queue_handler)
+        _stop_log_listener()
+    else:
+        atexit.register(_stop_log_listener)
+    
+    # QueueHandler.prepare formats each record in the calling thread; only the
+    # stream/file writes happen on the listener thread
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    _log_queue_handler = logging.handlers.QueueHandler(log_queue)
+    
+    root.setLevel(getattr(logging, log_level.upper()))
+    root.addHandler(_log_queue_handler)
 
 def generate_report_id() -> str:
     """Generate unique report ID"""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    random_suffix = hashlib.md5(str(datetime.now().microsecond).encode()).hexdigest()[:6]
+    random_suffix = os.urandom(3).hex()
     return f"{timestamp}_{random_suffix}"
 
-def export_to_csv(data: List[Dict], filename: str, directory: str = 'data/exports'):
-    """Export data to CSV file"""
+def export_to_csv(data: Iterable[Dict], filename: str, directory: str = 'data/exports',
+                  fieldnames: Optional[List[str]] = None):
+    """Export data to CSV file, streaming rows from any iterable"""
     try:
         os.makedirs(directory, exist_ok=True)
         filepath = os.path.join(directory, filename)
         
-        if not data:
+        # Columns come from the caller or the first row; rows are never collected into a list
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             logger.warning("No data to export")
             return
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
+        if fieldnames is None:
+            fieldnames = list(first.keys())
+        
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1024 * 1024) as f:
+            # Missing keys are written empty; keys outside fieldnames raise ValueError
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(data)
+            writer.writerow(first)
+            writer.writerows(rows)
         
         logger.info(f"Exported data to {filepath}")
         
     except Exception as e:
         logger.error(f"Error exporting to CSV: {e}")
 
-def batch_process(items: List, process_func, batch_size: int = 10, delay: float = 1.0):
-    """Process items in batches with delay"""
-    results = []
-    
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i + batch_size]
-        
-        logger.info(f"Processing batch {i//batch_size + 1}/{(len(items)-1)//batch_size + 1}")
-        
-        for item in batch:
+def batch_process(items: List, process_func, batch_size: int = 10, delay: float = 1.0, max_workers: int = 5,
+                  max_retries: int = 3):
+    """Process items in batches with delay, items within a batch run concurrently"""
+    def process_item(item):
+        for attempt in range(max_retries + 1):
             try:
-                result = process_func(item)
-                results.append(result)
+                return process_func(item)
+            except RateLimitExceeded as e:
+                if attempt < max_retries:
+                    # Throttled: wait as told, else back off exponentially, then retry the item
+                    wait = e.retry_after or min(60.0, max(delay, 1.0) * 2 ** attempt)
+                    logger.warning(f"Rate limited, retrying item in {wait:.1f}s: {e}")
+                    time.sleep(wait)
+                    continue
+                logger.error(f"Error processing item: {e}")
+                return {'error': str(e), 'item': item}
             except Exception as e:
                 logger.error(f"Error processing item: {e}")
-                results.append({'error': str(e), 'item': item})
-        
-        if i + batch_size < len(items):
-            import time
-            time.sleep(delay)
+                return {'error': str(e), 'item': item}
+    
+    results = []
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, batch_size))) as executor:
+        for i in range(0, len(items), batch_size):
+            batch = items[i:i + batch_size]
+            batch_started = time.monotonic()
+            
+            logger.info(f"Processing batch {i//batch_size + 1}/{(len(items)-1)//batch_size + 1}")
+            
+            results.extend(executor.map(process_item, batch))
+            
+            # Batches start at least `delay` apart; time spent processing counts towards it
+            if i + batch_size < len(items):
+                time.sleep(max(0.0, delay - (time.monotonic() - batch_started)))
     
     return results
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for filesystem"""
-    import re
-    # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Limit length
-    if len(sanitized) > 255:
-        sanitized = sanitized[:255]
-    return sanitized
+    # Replace invalid characters and limit length
+    return filename.translate(_SANITIZE_FILENAME_TRANS)[:255]
 
 def ensure_directory_exists(path: str):
     """Ensure directory exists, create if not"""
@@ -704,27 +855,62 @@ def ensure_directory_exists(path: str):
     except Exception as e:
         logger.error(f"Error creating directory {path}: {e}")
 
-def get_file_hash(filepath: str) -> str:
-    """Get MD5 hash of file"""
+def get_file_hash(filepath: str, algorithm: str = 'sha256') -> str:
+    """Get hash of file (SHA-256 unless another hashlib algorithm, or 'blake3', is given)"""
+    # hashlib has no BLAKE3, so without the package every digest would silently be ""
+    if algorithm == 'blake3' and blake3 is None:
+        raise ImportError("get_file_hash(..., algorithm='blake3') requires the blake3 package")
+    
     try:
-        hash_md5 = hashlib.md5()
+        if algorithm == 'blake3':
+            # Multithreaded SIMD hashing over a memory map of the file
+            file_hash = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            file_hash.update_mmap(filepath)
+            return file_hash.hexdigest()
+        
         with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            
+            file_hash = hashlib.new(algorithm)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(chunk)
+            return file_hash.hexdigest()
     except Exception as e:
         logger.error(f"Error calculating file hash: {e}")
         return ""
 
+def get_file_hashes(filepaths: List[str], algorithm: str = 'sha256', max_workers: int = 8) -> Dict[str, str]:
+    """Hash many files concurrently, returns {path: hexdigest}"""
+    if not filepaths:
+        return {}
+    
+    # hashlib releases the GIL on large buffers, so reads and hashing of different files overlap
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(filepaths)))) as executor:
+        return dict(zip(filepaths, executor.map(lambda path: get_file_hash(path, algorithm), filepaths)))
+
+def git_blob_sha(content: bytes) -> str:
+    """Get the sha git (and GitHub) assigns to a blob with this content"""
+    blob_hash = hashlib.sha1()
+    blob_hash.update(b'blob %d\0' % len(content))
+    blob_hash.update(content)
+    return blob_hash.hexdigest()
+
 def merge_configs(base_config: Dict, override_config: Dict) -> Dict:
     """Merge two configuration dictionaries"""
     merged = base_config.copy()
     
-    for key, value in override_config.items():
-        if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-            merged[key] = merge_configs(merged[key], value)
-        else:
-            merged[key] = value
+    # Walk both trees with an explicit stack; only dicts that both sides define get copied
+    stack = [(merged, override_config)]
+    while stack:
+        target, overrides = stack.pop()
+        for key, value in overrides.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current.copy()
+                stack.append((target[key], value))
+            else:
+                target[key] = value
     
     return merged
 